@@ -1,6 +1,5 @@
 # dashboard.py
 import streamlit as st
-import os
 from pathlib import Path
 
 # --- Page Configuration ---
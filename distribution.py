@@ -2,11 +2,18 @@ import os.path
 import datetime
 import yaml
 import pandas as pd
+import numpy as np
 import logging
+import logging.handlers
+import queue
+import atexit
 import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from settings_io import read_settings_cached
 
 # --- Configuration ---
 SPREADSHEET_ID = '1ZkTB3ahmrQ2-7rz-h1RdkOMPSHmkAhpFJIH64Ca0jxk'
@@ -18,6 +25,10 @@ SERVICE_ACCOUNT_FILE = 'molten-medley-458604-j9-855f3bdefd90.json'
 # Scopes required for reading and writing
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Retries for transient Sheets API errors (rate limits and server-side failures). googleapiclient
+# backs off exponentially between attempts; only idempotent requests are retried
+API_NUM_RETRIES = 5
+
 # Define call status priorities and report categories
 CALL_PRIORITIES = {
     1: ["NDR"],
@@ -37,6 +48,12 @@ STATUS_TO_REPORT_CATEGORY = {
     "NDR": "NDR"
 }
 
+# Columns (A:Z) blanked when an existing report section for today is replaced
+REPORT_CLEAR_WIDTH = 26
+
+# Order in which categories are listed for each stakeholder in the report
+REPORT_CATEGORY_ORDER = ["Fresh", "Abandoned", "Invalid/Fake", "CNP", "Follow up", "NDR"]
+
 # Sheet structure definition
 HEADER_ROW_INDEX = 1  # 0-indexed
 DATA_START_ROW_INDEX = 2  # 0-indexed
@@ -56,14 +73,21 @@ COL_NAMES = {
 
 # --- Logging Setup ---
 LOG_FILE = 'distribution_script.log'
+# Records are queued by the calling thread and written to the file and stdout by a listener thread,
+# so logging from the processing loop never waits on disk or pipe I/O
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.FileHandler(LOG_FILE),
+    logging.StreamHandler(sys.stdout)
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop) # Drains the queue before the interpreter exits
 logger = logging.getLogger(__name__)
 
 # --- Load Settings Function ---
@@ -71,8 +95,7 @@ def load_settings(filename):
     """Loads configuration from a YAML file."""
     logger.info(f"Loading settings from '{filename}'...")
     try:
-        with open(filename, 'r') as f:
-            settings = yaml.safe_load(f)
+        settings = read_settings_cached(filename)
         if not settings:
             logger.warning(f"Settings file '{filename}' is empty.")
             return None
@@ -89,37 +112,54 @@ def load_settings(filename):
         return None
 
 # --- Helper Functions ---
+@functools.lru_cache(maxsize=1024)  # Only a handful of distinct columns are ever converted
 def col_index_to_a1(index):
-    """Converts column index (0-based) to A1 notation."""
+    """Converts column index (0-based) to A1 notation (e.g., 0 -> A, 1 -> B)."""
     col = ''
     while index >= 0:
         col = chr(index % 26 + ord('A')) + col
         index = index // 26 - 1
     return col
 
-def assign_stakeholder_with_limits(current_index, stakeholder_list, stakeholder_assignments):
-    """Assigns a stakeholder to a record if they have not reached their limit."""
-    num_stakeholders = len(stakeholder_list)
-    for i in range(num_stakeholders):
-        index = (current_index + i) % num_stakeholders
-        stakeholder = stakeholder_list[index]
-        name = stakeholder['name']
-        if stakeholder_assignments[name] < stakeholder['limit']:
-            stakeholder_assignments[name] += 1
-            next_index = (index + 1) % num_stakeholders
-            return name, next_index
-    logger.debug("No stakeholder has remaining capacity for assignment.")
-    return None, current_index
+def group_contiguous_rows(row_numbers):
+    """Splits ascending sheet row numbers into (start, end) positions of consecutive runs."""
+    runs = []
+    run_start = 0
+    for i in range(1, len(row_numbers) + 1):
+        if i == len(row_numbers) or row_numbers[i] != row_numbers[i - 1] + 1:
+            runs.append((run_start, i - 1))
+            run_start = i
+    return runs
+
+def build_header_positions(header):
+    """Maps each header name to its column index (0-based). Duplicate names keep the first, like list.index()."""
+    header_positions = {}
+    for col_index, col_name in enumerate(header):
+        header_positions.setdefault(col_name, col_index)
+    return header_positions
+
+def build_assignment_schedule(stakeholder_list, num_records):
+    """Returns the stakeholder names to hand out, in order, for up to num_records records."""
+    # A limit-aware round robin starting at the first stakeholder gives, in round r, one record
+    # to every stakeholder (in list order) whose limit is above r. Lay that out as a
+    # rounds x stakeholders capacity mask and read it row by row.
+    names = np.array([stakeholder['name'] for stakeholder in stakeholder_list], dtype=object)
+    limits = np.array([int(stakeholder['limit']) for stakeholder in stakeholder_list])
+    num_rounds = min(int(limits.max(initial=0)), num_records)
+    has_capacity = np.arange(num_rounds)[:, None] < limits[None, :]
+    schedule = np.broadcast_to(names, has_capacity.shape)[has_capacity]
+    return schedule[:num_records]
 
 # --- Authentication ---
-def authenticate_google_sheets():
-    """Authenticates using a service account key file."""
-    creds = None
+@functools.lru_cache(maxsize=1)
+def load_credentials():
+    """Loads service account credentials from the local key file, once per process."""
     logger.info(f"Loading service account credentials from '{SERVICE_ACCOUNT_FILE}'...")
     try:
         creds = service_account.Credentials.from_service_account_file(
             SERVICE_ACCOUNT_FILE, scopes=SCOPES)
         logger.info("Credentials loaded successfully.")
+        return creds
     except FileNotFoundError:
         logger.error(f"Error: Service account key file '{SERVICE_ACCOUNT_FILE}' not found.")
         return None
@@ -127,9 +167,19 @@ def authenticate_google_sheets():
         logger.error(f"Error loading service account credentials: {e}")
         return None
 
+def authenticate_google_sheets():
+    """Authenticates using a service account key file."""
+    # The credentials are cached, but each call still builds its own service:
+    # service objects are not thread-safe and the report search runs on a worker thread
+    creds = load_credentials()
+    if creds is None:
+        return None
+
     logger.info("Building Google Sheets API service...")
     try:
-        service = build('sheets', 'v4', credentials=creds)
+        # static_discovery=True uses the discovery document bundled with google-api-python-client
+        # instead of fetching it over the network; cache_discovery=False skips the file cache probe/write
+        service = build('sheets', 'v4', credentials=creds, static_discovery=True, cache_discovery=False)
         return service
     except HttpError as e:
         logger.error(f"Google Sheets API Error during service build: {e}")
@@ -141,7 +191,8 @@ def authenticate_google_sheets():
 
 # --- Find Existing Report Range ---
 def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_date_str):
-    """Searches the report sheet for today's report section."""
+    """Searches the report sheet for today's report section. Returns (start_row, end_row, last_row_in_sheet)."""
+    # last_row_in_sheet is None when column A could not be read (missing sheet or unexpected error)
     start_title = f"--- Stakeholder Report for Assignments on {today_date_str} ---"
     any_report_start_pattern = "--- Stakeholder Report for Assignments on "
 
@@ -151,46 +202,58 @@ def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_d
     last_row_in_sheet = 0
 
     try:
+        # Raw values skip server-side formatting, and COLUMNS gives column A as one flat list
         result = sheet.values().get(
             spreadsheetId=spreadsheet_id,
-            range=f'{report_sheet_name}!A:A'
-        ).execute()
-        values = result.get('values', [])
-        last_row_in_sheet = len(values)
+            range=f'{report_sheet_name}!A:A',
+            valueRenderOption='UNFORMATTED_VALUE',
+            majorDimension='COLUMNS'
+        ).execute(num_retries=API_NUM_RETRIES)
+        column_values = result.get('values', [])
+        # Unformatted numeric cells come back as numbers, so cast before stripping
+        column_a = [str(cell).strip() for cell in column_values[0]] if column_values else []
+        last_row_in_sheet = len(column_a)
         logger.debug(f"Read {last_row_in_sheet} rows from column A of '{report_sheet_name}'.")
 
-        for i in range(last_row_in_sheet):
-            row_value = values[i][0].strip() if values[i] and values[i][0] else ''
-            if row_value == start_title:
+        # Only report title rows can start or end a section, so collect those once and search them
+        report_title_rows = [i for i, row_value in enumerate(column_a) if row_value.startswith(any_report_start_pattern)]
+        for position, i in enumerate(report_title_rows):
+            if column_a[i] == start_title:
                 start_row = i + 1
                 logger.info(f"Found existing report start for {today_date_str} at row {start_row}.")
+                if position + 1 < len(report_title_rows):
+                    next_start_row = report_title_rows[position + 1] + 1
+                    logger.debug(f"Found start of next report section at row {next_start_row}.")
                 break
 
         if start_row is None:
             logger.info(f"No existing report found for {today_date_str}.")
-            return None, None
-
-        for i in range(start_row, last_row_in_sheet):
-            row_value = values[i][0].strip() if values[i] and values[i][0] else ''
-            if row_value.startswith(any_report_start_pattern):
-                next_start_row = i + 1
-                logger.debug(f"Found start of next report section at row {next_start_row}.")
-                break
+            return None, None, last_row_in_sheet
 
         end_row_to_clear = next_start_row - 1 if next_start_row else last_row_in_sheet
         end_row_to_clear = max(start_row, end_row_to_clear)
-        return start_row, end_row_to_clear
+        return start_row, end_row_to_clear, last_row_in_sheet
 
     except HttpError as e:
         if 'Unable to parse range' in str(e) or e.resp.status == 400:
             logger.warning(f"Sheet '{report_sheet_name}' not found. It will be created on write.")
-            return None, None
+            return None, None, None
         else:
             logger.error(f"Google Sheets API Error while searching for existing report: {e}")
             raise
     except Exception as e:
         logger.exception(f"Unexpected error while searching for existing report:")
-        return None, None
+        return None, None, None
+
+def find_existing_report_range_with_own_service(spreadsheet_id, report_sheet_name, today_date_str):
+    """Runs find_existing_report_range on its own service so it can be called from a worker thread."""
+    # googleapiclient services share one httplib2 connection and are not thread-safe.
+    # Returning None lets the caller fall back to searching with its own service.
+    service = authenticate_google_sheets()
+    if not service:
+        logger.warning("Could not build a separate service for the report search.")
+        return None
+    return find_existing_report_range(service.spreadsheets(), spreadsheet_id, report_sheet_name, today_date_str)
 
 # --- Main Processing Function ---
 def distribute_and_report():
@@ -207,8 +270,6 @@ def distribute_and_report():
         return
     logger.info(f"Loaded {len(stakeholder_list)} stakeholders: {[s['name'] for s in stakeholder_list]}")
 
-    # Initialize assignment tracking
-    stakeholder_assignments = {stakeholder['name']: 0 for stakeholder in stakeholder_list}
     stakeholder_names = [stakeholder['name'] for stakeholder in stakeholder_list]
 
     service = authenticate_google_sheets()
@@ -218,63 +279,74 @@ def distribute_and_report():
     sheet = service.spreadsheets()
 
     try:
+        # --- Read Header ---
+        header_row_number = HEADER_ROW_INDEX + 1
+        logger.info(f"Reading header from '{ORDERS_SHEET_NAME}' (row {header_row_number})...")
+        header_range = f'{ORDERS_SHEET_NAME}!A{header_row_number}:BD{header_row_number}'
+        result = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=header_range).execute(num_retries=API_NUM_RETRIES)
+        header_values = result.get('values', [])
+
+        if not header_values or not header_values[0]:
+            logger.warning(f"No header found in '{ORDERS_SHEET_NAME}' (row {header_row_number}).")
+            return
+
+        header = [str(h).strip() if h is not None else '' for h in header_values[0]]
+        header_length = len(header)
+        header_positions = build_header_positions(header)
+        logger.info(f"Header row (row {header_row_number}) with {header_length} columns identified.")
+
         # --- Read Data ---
-        logger.info(f"Reading data from '{ORDERS_SHEET_NAME}'...")
-        read_range = f'{ORDERS_SHEET_NAME}!A:BD'
-        result = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=read_range).execute()
-        values = result.get('values', [])
+        # Only the columns listed in COL_NAMES are fetched, one column range each, in a single batchGet
+        col_positions = {col_name: header_positions[col_name] for col_name in COL_NAMES.values() if col_name in header_positions}
 
-        if not values:
-            logger.warning(f"No data found in '{ORDERS_SHEET_NAME}'.")
+        if not col_positions:
+            logger.error(f"None of the expected columns were found in the '{ORDERS_SHEET_NAME}' header.")
             return
 
-        logger.info(f"Read {len(values)} rows from '{ORDERS_SHEET_NAME}'.")
-
-        if len(values) < DATA_START_ROW_INDEX + 1:
-            logger.error(f"Not enough rows in '{ORDERS_SHEET_NAME}'. Need at least {DATA_START_ROW_INDEX + 1}. Found {len(values)}.")
+        data_start_row_number = DATA_START_ROW_INDEX + 1
+        read_ranges = [
+            f'{ORDERS_SHEET_NAME}!{col_index_to_a1(col_index)}{data_start_row_number}:{col_index_to_a1(col_index)}'
+            for col_index in col_positions.values()
+        ]
+        logger.info(f"Reading {len(read_ranges)} columns from '{ORDERS_SHEET_NAME}'...")
+        result = sheet.values().batchGet(
+            spreadsheetId=SPREADSHEET_ID, ranges=read_ranges, majorDimension='COLUMNS').execute(num_retries=API_NUM_RETRIES)
+
+        column_cells = {}
+        for col_name, value_range in zip(col_positions, result.get('valueRanges', [])):
+            column_values = value_range.get('values', [])
+            column_cells[col_name] = column_values[0] if column_values else []
+
+        # The API trims trailing empty cells, so columns come back with different lengths
+        num_data_rows = max((len(cells) for cells in column_cells.values()), default=0)
+        if num_data_rows == 0:
+            logger.warning(f"No data rows found in '{ORDERS_SHEET_NAME}'.")
             return
 
-        header = [str(h).strip() if h is not None else '' for h in values[HEADER_ROW_INDEX]]
-        header_length = len(header)
-        logger.info(f"Header row (row {HEADER_ROW_INDEX + 1}) with {header_length} columns identified.")
-
-        # --- Pad Data Rows ---
-        data_rows_raw = values[DATA_START_ROW_INDEX:]
-        padded_data_rows = []
-        for i, row in enumerate(data_rows_raw):
-            processed_row = [str(cell).strip() if cell is not None else '' for cell in row]
-            if len(processed_row) < header_length:
-                processed_row.extend([''] * (header_length - len(processed_row)))
-            elif len(processed_row) > header_length:
-                logger.warning(f"Row {DATA_START_ROW_INDEX + i + 1} has more columns ({len(processed_row)}) than header ({header_length}). Truncating.")
-                processed_row = processed_row[:header_length]
-            padded_data_rows.append(processed_row)
-
-        logger.info(f"Processed {len(padded_data_rows)} data rows.")
-
-        df = pd.DataFrame(padded_data_rows, columns=header)
-        df['_original_row_index'] = range(DATA_START_ROW_INDEX + 1, DATA_START_ROW_INDEX + 1 + len(df))
-        logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns.")
-
-        # --- Prepare DataFrame Columns ---
-        for col_key, col_name in COL_NAMES.items():
-            if col_name not in df.columns:
-                logger.warning(f"Column '{col_name}' not found in DataFrame. Adding it as empty.")
-                df[col_name] = ''
-            df[col_name] = df[col_name].astype(str)
-
-        # Clean up status column
-        df[COL_NAMES['call_status']] = df[COL_NAMES['call_status']].fillna('').astype(str).str.strip()
+        logger.info(f"Read {num_data_rows} data rows from '{ORDERS_SHEET_NAME}'.")
+
+        # --- Prepare Columns ---
+        # Each needed column is kept as a cleaned object array; no DataFrame is built for the rows
+        columns = {}
+        for col_name in COL_NAMES.values():
+            cells = column_cells.get(col_name)
+            if cells is None:
+                logger.warning(f"Column '{col_name}' not found in sheet header. Treating it as empty.")
+                cells = []
+            column = np.full(num_data_rows, '', dtype=object)
+            column[:len(cells)] = [str(cell).strip() for cell in cells]
+            columns[col_name] = column
+        original_row_numbers = np.arange(DATA_START_ROW_INDEX + 1, DATA_START_ROW_INDEX + 1 + num_data_rows)
 
         # --- Filter Rows for Processing ---
         logger.info("Filtering rows based on priority statuses...")
         all_priority_statuses = [status for priority_list in CALL_PRIORITIES.values() for status in priority_list]
-        rows_to_process_df = df[df[COL_NAMES['call_status']].isin(all_priority_statuses)].copy()
-        filtered_indices = rows_to_process_df.index.tolist()
+        filtered_positions = np.flatnonzero(np.isin(columns[COL_NAMES['call_status']], all_priority_statuses))
+        num_filtered = len(filtered_positions)
 
-        logger.info(f"Found {len(filtered_indices)} rows matching priority statuses.")
+        logger.info(f"Found {num_filtered} rows matching priority statuses.")
 
-        if not filtered_indices:
+        if num_filtered == 0:
             logger.info("No rows matched filter criteria. Skipping assignments and report.")
             return
 
@@ -282,47 +354,68 @@ def distribute_and_report():
         today_date_str_for_sheet = datetime.date.today().strftime("%d-%b-%Y")
         today_date_str_for_report = datetime.date.today().strftime("%d-%b-%Y")
 
-        logger.info(f"Processing {len(filtered_indices)} filtered rows for assignments with limits...")
-        current_index = 0
-        report_counts = {
-            name: {"Total": 0, "Fresh": 0, "Abandoned": 0, "Invalid/Fake": 0, "CNP": 0, "Follow up": 0, "NDR": 0}
-            for name in stakeholder_names
-        }
-
-        for df_index in filtered_indices:
-            assigned_stakeholder, current_index = assign_stakeholder_with_limits(current_index, stakeholder_list, stakeholder_assignments)
-            if assigned_stakeholder is None:
-                logger.debug(f"Row {df.loc[df_index, '_original_row_index']} not assigned: all stakeholders at capacity.")
-                continue
-            row_data = df.loc[df_index]
-            df.loc[df_index, COL_NAMES['stakeholder']] = assigned_stakeholder
-            call_status = row_data.get(COL_NAMES['call_status'], '').strip()
-            date1_val = str(row_data.get(COL_NAMES['date_col'], '')).strip()
-            date2_val = str(row_data.get(COL_NAMES['date_col_2'], '')).strip()
-            date3_val = str(row_data.get(COL_NAMES['date_col_3'], '')).strip()
-
-            # Update report counts
-            report_counts[assigned_stakeholder]["Total"] += 1
-            report_category = STATUS_TO_REPORT_CATEGORY.get(call_status)
-            if report_category:
-                report_counts[assigned_stakeholder][report_category] += 1
-
-            # Date logic
+        logger.info(f"Processing {num_filtered} filtered rows for assignments with limits...")
+
+        # Fancy indexing returns copies, so the working arrays can be modified freely
+        original_row_values = original_row_numbers[filtered_positions]
+        call_status_values = columns[COL_NAMES['call_status']][filtered_positions]
+        stakeholder_out = columns[COL_NAMES['stakeholder']][filtered_positions]
+        date_out_1 = columns[COL_NAMES['date_col']][filtered_positions]
+        date_out_2 = columns[COL_NAMES['date_col_2']][filtered_positions]
+        date_out_3 = columns[COL_NAMES['date_col_3']][filtered_positions]
+
+        # Rows past the end of the schedule stay unassigned: every stakeholder is at capacity
+        assignment_schedule = build_assignment_schedule(stakeholder_list, num_filtered)
+        num_assignable = len(assignment_schedule)
+        stakeholder_out[:num_assignable] = assignment_schedule
+        if num_assignable < num_filtered:
+            logger.info(f"{num_filtered - num_assignable} rows not assigned: all stakeholders at capacity.")
+
+        for i in range(num_assignable):
+            original_row = original_row_values[i]
+            call_status = call_status_values[i]
+            date1_val = date_out_1[i]
+            date2_val = date_out_2[i]
+            date3_val = date_out_3[i]
+
+            # Date logic (per-row debug messages use lazy %-formatting: skipped entirely at INFO level)
             if call_status == "Call didn't Pick":
                 if not date1_val:
-                    df.loc[df_index, COL_NAMES['date_col']] = today_date_str_for_sheet
-                    logger.debug(f"Row {row_data['_original_row_index']}: CNP, 1st attempt. Set Date to {today_date_str_for_sheet}.")
+                    date_out_1[i] = today_date_str_for_sheet
+                    logger.debug("Row %s: CNP, 1st attempt. Set Date to %s.", original_row, today_date_str_for_sheet)
                 elif not date2_val:
-                    df.loc[df_index, COL_NAMES['date_col_2']] = today_date_str_for_sheet
-                    logger.debug(f"Row {row_data['_original_row_index']}: CNP, 2nd attempt. Set Date 2 to {today_date_str_for_sheet}.")
+                    date_out_2[i] = today_date_str_for_sheet
+                    logger.debug("Row %s: CNP, 2nd attempt. Set Date 2 to %s.", original_row, today_date_str_for_sheet)
                 elif not date3_val:
-                    df.loc[df_index, COL_NAMES['date_col_3']] = today_date_str_for_sheet
-                    logger.debug(f"Row {row_data['_original_row_index']}: CNP, 3rd attempt. Set Date 3 to {today_date_str_for_sheet}.")
+                    date_out_3[i] = today_date_str_for_sheet
+                    logger.debug("Row %s: CNP, 3rd attempt. Set Date 3 to %s.", original_row, today_date_str_for_sheet)
                 else:
-                    logger.debug(f"Row {row_data['_original_row_index']}: CNP, 3 attempts already logged. Dates unchanged.")
+                    logger.debug("Row %s: CNP, 3 attempts already logged. Dates unchanged.", original_row)
             else:
-                df.loc[df_index, COL_NAMES['date_col']] = today_date_str_for_sheet
-                logger.debug(f"Row {row_data['_original_row_index']}: Status '{call_status}'. Set Date to {today_date_str_for_sheet}.")
+                date_out_1[i] = today_date_str_for_sheet
+                logger.debug("Row %s: Status '%s'. Set Date to %s.", original_row, call_status, today_date_str_for_sheet)
+
+        # --- Count Assignments per Stakeholder and Category ---
+        assigned_df = pd.DataFrame({
+            'stakeholder': assignment_schedule,
+            'category': pd.Series(call_status_values[:num_assignable], dtype=object).map(STATUS_TO_REPORT_CATEGORY),
+        })
+        category_counts = pd.crosstab(assigned_df['stakeholder'], assigned_df['category']).reindex(
+            index=list(dict.fromkeys(stakeholder_names)), columns=REPORT_CATEGORY_ORDER, fill_value=0)
+        total_counts = assigned_df['stakeholder'].value_counts()
+        report_counts = {
+            name: {"Total": int(total_counts.get(name, 0)),
+                   **{category: int(category_counts.at[name, category]) for category in REPORT_CATEGORY_ORDER}}
+            for name in stakeholder_names
+        }
+
+        # Final values of the written columns for the filtered rows, in filtered-row order
+        updated_column_values = {
+            COL_NAMES['stakeholder']: stakeholder_out,
+            COL_NAMES['date_col']: date_out_1,
+            COL_NAMES['date_col_2']: date_out_2,
+            COL_NAMES['date_col_3']: date_out_3,
+        }
 
         logger.info(f"Assigned and processed {sum(c['Total'] for c in report_counts.values())} rows.")
 
@@ -334,38 +427,49 @@ def distribute_and_report():
         max_col_index_to_write = -1
 
         for col_name in cols_to_update_names:
-            try:
-                col_index = header.index(col_name)
-                sheet_col_indices[col_name] = col_index
-                max_col_index_to_write = max(max_col_index_to_write, col_index)
-                logger.debug(f"Found column '{col_name}' at index {col_index}.")
-            except ValueError:
+            col_index = header_positions.get(col_name, -1)
+            sheet_col_indices[col_name] = col_index
+            if col_index == -1:
                 logger.warning(f"Column '{col_name}' not found in sheet header. Cannot write to this column.")
-                sheet_col_indices[col_name] = -1
+                continue
+            max_col_index_to_write = max(max_col_index_to_write, col_index)
+            logger.debug(f"Found column '{col_name}' at index {col_index}.")
 
         if max_col_index_to_write != -1:
-            for df_index in filtered_indices:
-                if df.loc[df_index, COL_NAMES['stakeholder']]:  # Only update assigned rows
-                    original_sheet_row = df.loc[df_index, '_original_row_index']
-                    row_values_to_write = [None] * (max_col_index_to_write + 1)
-                    for col_name in cols_to_update_names:
-                        if sheet_col_indices.get(col_name, -1) != -1:
-                            row_values_to_write[sheet_col_indices[col_name]] = df.loc[df_index, col_name]
+            rows_to_write_mask = stakeholder_out != ''  # Only update assigned rows
+            sheet_rows = original_row_values[rows_to_write_mask].tolist()
+            row_runs = group_contiguous_rows(sheet_rows)
+
+            # One narrow range per column and run of consecutive rows, instead of a padded A..max_col row per assignment
+            for col_name in cols_to_update_names:
+                if sheet_col_indices.get(col_name, -1) == -1:
+                    continue
+                col_letter = col_index_to_a1(sheet_col_indices[col_name])
+                col_values = updated_column_values[col_name][rows_to_write_mask].tolist()
+                for run_start, run_end in row_runs:
                     updates.append({
-                        'range': f'{ORDERS_SHEET_NAME}!A{original_sheet_row}',
-                        'values': [row_values_to_write]
+                        'range': f'{ORDERS_SHEET_NAME}!{col_letter}{sheet_rows[run_start]}:{col_letter}{sheet_rows[run_end]}',
+                        'values': [[value] for value in col_values[run_start:run_end + 1]]
                     })
 
-            logger.info(f"Prepared {len(updates)} row updates for Orders sheet batch write.")
+            logger.info(f"Prepared {len(updates)} range updates covering {len(sheet_rows)} rows for Orders sheet batch write.")
         else:
             logger.warning("No writeable columns found in header. No updates prepared.")
 
+        # Search the report sheet in the background while the Orders batch update is in flight;
+        # the two calls touch different sheets, so their round trips can overlap
+        report_executor = ThreadPoolExecutor(max_workers=1)
+        report_range_future = report_executor.submit(
+            find_existing_report_range_with_own_service, SPREADSHEET_ID, REPORT_SHEET_NAME, today_date_str_for_report
+        )
+        report_executor.shutdown(wait=False)
+
         # Execute batch update
         if updates:
             logger.info("Executing batch update to Orders sheet...")
             body = {'value_input_option': 'RAW', 'data': updates}
             try:
-                result = sheet.values().batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+                result = sheet.values().batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute(num_retries=API_NUM_RETRIES)
                 logger.info(f"Batch update completed. {result.get('totalUpdatedCells', 'N/A')} cells updated.")
             except HttpError as e:
                 logger.error(f"API Error during batch update: {e}")
@@ -376,41 +480,47 @@ def distribute_and_report():
 
         # --- Generate Stakeholder Report ---
         logger.info("Generating Stakeholder Report...")
-        formatted_report_values = []
-        formatted_report_values.append([f"--- Stakeholder Report for Assignments on {today_date_str_for_report} ---"])
-        formatted_report_values.append([''])
-
-        report_category_order = ["Fresh", "Abandoned", "Invalid/Fake", "CNP", "Follow up", "NDR"]
-
-        for stakeholder in stakeholder_names:
-            formatted_report_values.append([f"Calls assigned {stakeholder}"])
-            formatted_report_values.append([f"- Total Calls This Run - {report_counts[stakeholder]['Total']}"])
-            for category in report_category_order:
-                formatted_report_values.append([f"- {category} - {report_counts[stakeholder][category]}"])
-            formatted_report_values.append([''])
-
-        formatted_report_values.append(['--- End of Report for ' + today_date_str_for_report + ' ---'])
+        formatted_report_values = [
+            [f"--- Stakeholder Report for Assignments on {today_date_str_for_report} ---"],
+            [''],
+            *(
+                row
+                for stakeholder in stakeholder_names
+                for row in (
+                    [f"Calls assigned {stakeholder}"],
+                    [f"- Total Calls This Run - {report_counts[stakeholder]['Total']}"],
+                    *([f"- {category} - {report_counts[stakeholder][category]}"] for category in REPORT_CATEGORY_ORDER),
+                    [''],
+                )
+            ),
+            ['--- End of Report for ' + today_date_str_for_report + ' ---'],
+        ]
         logger.info(f"Formatted report data ({len(formatted_report_values)} rows).")
 
         # --- Write Report ---
         logger.info(f"Writing report to '{REPORT_SHEET_NAME}'...")
-        start_row_existing, end_row_existing = find_existing_report_range(
-            sheet, SPREADSHEET_ID, REPORT_SHEET_NAME, today_date_str_for_report
-        )
+        report_range = report_range_future.result()  # Re-raises any API error from the search
+        if report_range is None:
+            report_range = find_existing_report_range(sheet, SPREADSHEET_ID, REPORT_SHEET_NAME, today_date_str_for_report)
+        start_row_existing, end_row_existing, last_row_in_report = report_range
 
         if start_row_existing is not None and end_row_existing is not None:
             logger.info(f"Existing report for {today_date_str_for_report} found. Updating range...")
-            range_to_clear = f'{REPORT_SHEET_NAME}!A{start_row_existing}:Z{end_row_existing}'
             range_to_write_new = f'{REPORT_SHEET_NAME}!A{start_row_existing}'
+            # Overwrite the old section (A:Z, as far as it went) with blanks in the same request as the
+            # new report, instead of a separate clear call. Rows past the old section are written as-is.
+            rows_in_old_section = end_row_existing - start_row_existing + 1
+            report_rows_to_write = [
+                row + [''] * (REPORT_CLEAR_WIDTH - len(row)) if i < rows_in_old_section else row
+                for i, row in enumerate(formatted_report_values)
+            ]
+            report_rows_to_write.extend([[''] * REPORT_CLEAR_WIDTH] * (rows_in_old_section - len(formatted_report_values)))
             try:
-                logger.info(f"Clearing range: {range_to_clear}")
-                sheet.values().clear(spreadsheetId=SPREADSHEET_ID, range=range_to_clear).execute()
-                logger.info("Cleared old report data.")
-                logger.info(f"Writing new report data to range: {range_to_write_new}")
-                body = {'values': formatted_report_values}
+                logger.info(f"Replacing rows {start_row_existing}-{end_row_existing} with new report data from {range_to_write_new}")
+                body = {'values': report_rows_to_write}
                 result = sheet.values().update(
                     spreadsheetId=SPREADSHEET_ID, range=range_to_write_new,
-                    valueInputOption='RAW', body=body).execute()
+                    valueInputOption='RAW', body=body).execute(num_retries=API_NUM_RETRIES)
                 logger.info(f"Report updated. {result.get('updatedCells', 'N/A')} cells updated.")
             except HttpError as e:
                 logger.error(f"API Error while updating report: {e}")
@@ -419,28 +529,34 @@ def distribute_and_report():
         else:
             logger.info(f"No existing report for {today_date_str_for_report}. Appending new report...")
             start_row_for_append = 1
-            try:
-                result_existing_report = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=f'{REPORT_SHEET_NAME}!A:A').execute()
-                existing_values = result_existing_report.get('values', [])
-                if existing_values:
-                    start_row_for_append = len(existing_values) + 1
-                logger.info(f"Found {len(existing_values)} existing rows. New report starts at row {start_row_for_append}.")
-            except HttpError as e:
-                if 'Unable to parse range' in str(e) or e.resp.status == 400:
-                    logger.warning(f"Sheet '{REPORT_SHEET_NAME}' not found. Creating it.")
-                    try:
-                        body = {'requests': [{'addSheet': {'properties': {'title': REPORT_SHEET_NAME}}}]}
-                        sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
-                        logger.info(f"Created sheet '{REPORT_SHEET_NAME}'. Report starts at row {start_row_for_append}.")
-                    except Exception as create_err:
-                        logger.error(f"Error creating sheet '{REPORT_SHEET_NAME}': {create_err}")
-                        return
-                else:
-                    logger.error(f"API Error while checking/reading sheet for append: {e}")
-                    raise
-            except Exception as e:
-                logger.exception(f"Unexpected error while finding last row:")
-                return
+            if last_row_in_report is not None:
+                # The search above already read column A, so the append position is known
+                start_row_for_append = last_row_in_report + 1
+                logger.info(f"Found {last_row_in_report} existing rows. New report starts at row {start_row_for_append}.")
+            else:
+                # Column A could not be read during the search (e.g. the sheet does not exist yet)
+                try:
+                    result_existing_report = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=f'{REPORT_SHEET_NAME}!A:A').execute(num_retries=API_NUM_RETRIES)
+                    existing_values = result_existing_report.get('values', [])
+                    if existing_values:
+                        start_row_for_append = len(existing_values) + 1
+                    logger.info(f"Found {len(existing_values)} existing rows. New report starts at row {start_row_for_append}.")
+                except HttpError as e:
+                    if 'Unable to parse range' in str(e) or e.resp.status == 400:
+                        logger.warning(f"Sheet '{REPORT_SHEET_NAME}' not found. Creating it.")
+                        try:
+                            body = {'requests': [{'addSheet': {'properties': {'title': REPORT_SHEET_NAME}}}]}
+                            sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()  # Not retried: addSheet isn't idempotent
+                            logger.info(f"Created sheet '{REPORT_SHEET_NAME}'. Report starts at row {start_row_for_append}.")
+                        except Exception as create_err:
+                            logger.error(f"Error creating sheet '{REPORT_SHEET_NAME}': {create_err}")
+                            return
+                    else:
+                        logger.error(f"API Error while checking/reading sheet for append: {e}")
+                        raise
+                except Exception as e:
+                    logger.exception(f"Unexpected error while finding last row:")
+                    return
 
             if formatted_report_values:
                 body = {'values': formatted_report_values}
@@ -449,7 +565,7 @@ def distribute_and_report():
                 try:
                     result = sheet.values().update(
                         spreadsheetId=SPREADSHEET_ID, range=range_to_write_report,
-                        valueInputOption='RAW', body=body).execute()
+                        valueInputOption='RAW', body=body).execute(num_retries=API_NUM_RETRIES)
                     logger.info(f"Report written. {result.get('updatedCells', 'N/A')} cells updated.")
                 except HttpError as e:
                     logger.error(f"API Error while writing report: {e}")
@@ -793,14 +793,17 @@ import os.path
 import datetime
 import yaml
 import pandas as pd
+import numpy as np
+import importlib.util
 import logging
 import sys
-import json
-import streamlit as st
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.auth.exceptions import RefreshError
+from settings_io import read_settings_cached
 
 # --- Configuration ---
 SETTINGS_FILE = 'settings.yaml'
@@ -809,6 +812,14 @@ SERVICE_ACCOUNT_FILE = 'molten-medley-458604-j9-855f3bdefd90.json'
 # Scopes required for reading and writing
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Retries for transient Sheets API errors (rate limits and server-side failures). googleapiclient
+# backs off exponentially between attempts; only idempotent requests are retried
+API_NUM_RETRIES = 5
+
+# dtype for the cleaned text columns. pandas 2 only uses Arrow-backed strings when asked, so request
+# them whenever pyarrow is installed; without it 'string[pyarrow]' would raise, hence the str fallback
+STRING_DTYPE = 'string[pyarrow]' if importlib.util.find_spec('pyarrow') is not None else str
+
 # Sheet-specific constants
 ORDERS_SHEET_NAME = 'Orders'
 ORDERS_HEADER_ROW_INDEX = 1  # Orders sheet header is row 2 (0-indexed)
@@ -835,6 +846,17 @@ STATUS_TO_REPORT_CATEGORY = {
     "Follow up": "Follow up",
     "NDR": "NDR"
 }
+# Status column dtype for the report tally, over every priority status (the only ones that get
+# assigned): mapping a categorical looks up each distinct status once instead of once per row
+STATUS_CATEGORICAL_DTYPE = pd.CategoricalDtype([status for priority_list in CALL_PRIORITIES.values() for status in priority_list])
+
+# Report section markers. Each day's report starts with a title row made of the prefix, the date
+# and REPORT_TITLE_SUFFIX; the search for an existing report matches on these
+REPORT_TITLE_PREFIX = "--- Stakeholder Report for Assignments on "
+REPORT_TITLE_SUFFIX = " ---"
+
+# Largest number of ranges sent in one values.batchUpdate request; bigger write-backs are split
+BATCH_UPDATE_CHUNK_SIZE = 5000
 
 # Column Names for BOTH sheets (mapped)
 COL_NAMES_ORDERS = {
@@ -877,8 +899,7 @@ def load_settings(filename):
     """Loads configuration from a YAML file."""
     logger.info(f"Loading settings from '{filename}'...")
     try:
-        with open(filename, 'r') as f:
-            settings = yaml.safe_load(f)
+        settings = read_settings_cached(filename)
         if not settings:
             logger.warning(f"Settings file '{filename}' is empty.")
             return None
@@ -927,6 +948,7 @@ def load_settings(filename):
         return None
 
 # --- Helper Functions ---
+@functools.lru_cache(maxsize=1024)  # Only a handful of distinct columns are ever converted
 def col_index_to_a1(index):
     """Converts column index (0-based) to A1 notation (e.g., 0 -> A, 1 -> B)."""
     col = ''
@@ -949,24 +971,103 @@ def assign_stakeholder_with_limits(current_index, stakeholder_list, stakeholder_
     logger.debug("No stakeholder has remaining capacity for assignment.")
     return None, current_index
 
+def build_assignment_schedule(stakeholder_list, stakeholder_assignments, num_records):
+    """Returns the stakeholder_list positions to hand out, in order, for up to num_records records, and adds them to stakeholder_assignments."""
+    # Repeated assign_stakeholder_with_limits calls from index 0 give, in round r, one record to every
+    # stakeholder (in list order) with more than r assignments left. Lay that out as a
+    # rounds x stakeholders capacity mask and read it row by row.
+    remaining = np.array([stakeholder['limit'] - stakeholder_assignments[stakeholder['name']] for stakeholder in stakeholder_list])
+    num_rounds = min(int(remaining.max(initial=0)), num_records)
+    has_capacity = np.arange(num_rounds)[:, None] < remaining[None, :]
+    schedule = np.nonzero(has_capacity)[1][:num_records]  # Row-major, so column positions come out round by round
+    for stakeholder, count in zip(stakeholder_list, np.bincount(schedule, minlength=len(stakeholder_list))):
+        stakeholder_assignments[stakeholder['name']] += int(count)
+    return schedule
+
+def group_contiguous_rows(row_numbers):
+    """Splits ascending sheet row numbers into (start, end) positions of consecutive runs."""
+    runs = []
+    run_start = 0
+    for i in range(1, len(row_numbers) + 1):
+        if i == len(row_numbers) or row_numbers[i] != row_numbers[i - 1] + 1:
+            runs.append((run_start, i - 1))
+            run_start = i
+    return runs
+
+def batch_update_in_chunks(sheet, spreadsheet_id, updates):
+    """Writes the range updates with one RAW batchUpdate per BATCH_UPDATE_CHUNK_SIZE ranges. Returns the number of cells updated."""
+    total_updated_cells = 0
+    for chunk_start in range(0, len(updates), BATCH_UPDATE_CHUNK_SIZE):
+        body = {'value_input_option': 'RAW', 'data': updates[chunk_start:chunk_start + BATCH_UPDATE_CHUNK_SIZE]}
+        result = sheet.values().batchUpdate(spreadsheetId=spreadsheet_id, body=body, fields='totalUpdatedCells').execute(num_retries=API_NUM_RETRIES)
+        total_updated_cells += result.get('totalUpdatedCells', 0)
+    return total_updated_cells
+
+def build_header_positions(header):
+    """Maps each header name to its column index (0-based). Duplicate names keep the first, like list.index()."""
+    header_positions = {}
+    for col_index, col_name in enumerate(header):
+        header_positions.setdefault(col_name, col_index)
+    return header_positions
+
+def read_sheet_columns(sheet, spreadsheet_id, sheet_name, header_positions, col_names, data_start_row_index):
+    """Reads only the named columns below the header, in one batchGet, into a DataFrame."""
+    col_positions = {col_name: header_positions[col_name] for col_name in col_names if col_name in header_positions}
+
+    column_cells = {}
+    if col_positions:
+        data_start_row_number = data_start_row_index + 1
+        read_ranges = [
+            f'{sheet_name}!{col_index_to_a1(col_index)}{data_start_row_number}:{col_index_to_a1(col_index)}'
+            for col_index in col_positions.values()
+        ]
+        # Default (formatted) render: the stakeholder and date columns are written back as read, so
+        # their cells must come back exactly as the text shown in the sheet
+        result = sheet.values().batchGet(
+            spreadsheetId=spreadsheet_id, ranges=read_ranges, majorDimension='COLUMNS',
+            fields='valueRanges(range,values)').execute(num_retries=API_NUM_RETRIES)
+        for col_name, value_range in zip(col_positions, result.get('valueRanges', [])):
+            column_values = value_range.get('values', [])
+            column_cells[col_name] = column_values[0] if column_values else []
+
+    # The API trims trailing empty cells, so columns come back with different lengths. They are copied
+    # into one None-padded object block (columns not in the header stay all None), which the frame wraps
+    col_names = list(col_names)
+    num_rows = max((len(cells) for cells in column_cells.values()), default=0)
+    data = np.full((num_rows, len(col_names)), None, dtype=object)
+    for col_pos, col_name in enumerate(col_names):
+        cells = column_cells.get(col_name, [])
+        data[:len(cells), col_pos] = np.array(cells, dtype=object)
+    return pd.DataFrame(data, columns=col_names, copy=False)
+
 # --- Authentication ---
-def authenticate_google_sheets():
-    """Authenticates using Streamlit secrets or local service account file."""
+@functools.lru_cache(maxsize=1)
+def load_credentials():
+    """Loads service account credentials from Streamlit secrets or the local key file, once per process."""
     creds = None
-    # Check if running in Streamlit Cloud (or secrets are configured)
+    # Streamlit is imported here rather than at module level: the scripts only need it
+    # to read secrets, and this lets them run from a plain Python environment too
     try:
-        if 'GOOGLE_CREDENTIALS' in st.secrets:
-            logger.info("Loading credentials from Streamlit secrets...")
-            creds_info = st.secrets["GOOGLE_CREDENTIALS"].to_dict()
-            logger.debug(f"Streamlit secrets credentials keys: {list(creds_info.keys())}")
-            creds = service_account.Credentials.from_service_account_info(
-                creds_info, scopes=SCOPES)
-            logger.info("Credentials loaded successfully from secrets.")
-    except (KeyError, FileNotFoundError, st.errors.StreamlitAPIException) as e:
-        logger.info(f"Streamlit secrets not found or inaccessible: {e}. Falling back to local service account file...")
-    except Exception as e:
-        logger.error(f"Error parsing Streamlit secrets credentials: {e}")
-        return None
+        import streamlit as st
+    except ImportError:
+        st = None
+        logger.info("Streamlit is not installed. Falling back to local service account file...")
+
+    if st is not None:
+        # Check if running in Streamlit Cloud (or secrets are configured)
+        try:
+            if 'GOOGLE_CREDENTIALS' in st.secrets:
+                logger.info("Loading credentials from Streamlit secrets...")
+                creds_info = st.secrets["GOOGLE_CREDENTIALS"].to_dict()
+                logger.debug(f"Streamlit secrets credentials keys: {list(creds_info.keys())}")
+                creds = service_account.Credentials.from_service_account_info(
+                    creds_info, scopes=SCOPES)
+                logger.info("Credentials loaded successfully from secrets.")
+        except (KeyError, FileNotFoundError, st.errors.StreamlitAPIException) as e:
+            logger.info(f"Streamlit secrets not found or inaccessible: {e}. Falling back to local service account file...")
+        except Exception as e:
+            logger.error(f"Error parsing Streamlit secrets credentials: {e}")
+            return None
 
     # Fallback to local service account file if secrets are unavailable
     if creds is None:
@@ -982,13 +1083,22 @@ def authenticate_google_sheets():
             logger.error(f"Error loading service account credentials from file: {e}")
             return None
 
+    return creds
+
+def authenticate_google_sheets():
+    """Authenticates using Streamlit secrets or local service account file."""
+    creds = load_credentials()
     if creds is None:
         logger.error("No valid credentials loaded. Authentication failed.")
         return None
 
+    # Only the credentials are cached: a service wraps a single httplib2 connection, so the
+    # background reads each build their own rather than sharing one across threads
     logger.info("Building Google Sheets API service...")
     try:
-        service = build('sheets', 'v4', credentials=creds)
+        # static_discovery=True uses the discovery document bundled with google-api-python-client
+        # instead of fetching it over the network; cache_discovery=False skips the file cache probe/write
+        service = build('sheets', 'v4', credentials=creds, static_discovery=True, cache_discovery=False)
         return service
     except RefreshError as e:
         logger.error(f"Authentication failed due to invalid credentials: {e}")
@@ -1003,10 +1113,9 @@ def authenticate_google_sheets():
         return None
 
 # --- Find Existing Report Range ---
-def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_date_str):
-    """Searches the report sheet for today's report section."""
-    start_title = f"--- Stakeholder Report for Assignments on {today_date_str} ---"
-    any_report_start_pattern = "--- Stakeholder Report for Assignments on "
+def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_date_str, column_values=None):
+    """Searches the report sheet for today's report section. Reads column A unless `column_values` is already fetched."""
+    start_title = f"{REPORT_TITLE_PREFIX}{today_date_str}{REPORT_TITLE_SUFFIX}"
 
     logger.info(f"Searching for existing report section for {today_date_str} in '{report_sheet_name}'...")
     start_row = None
@@ -1014,33 +1123,32 @@ def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_d
     last_row_in_sheet = 0
 
     try:
-        result = sheet.values().get(
-            spreadsheetId=spreadsheet_id,
-            range=f'{report_sheet_name}!A:A'
-        ).execute()
-        values = result.get('values', [])
+        if column_values is None:
+            result = sheet.values().get(
+                spreadsheetId=spreadsheet_id,
+                range=f'{report_sheet_name}!A:A',
+                fields='values'
+            ).execute(num_retries=API_NUM_RETRIES)
+            column_values = result.get('values', [])
+        values = column_values
         last_row_in_sheet = len(values)
         logger.debug(f"Read {last_row_in_sheet} rows from column A of '{report_sheet_name}'.")
 
-        for i in range(last_row_in_sheet):
-            row_value = values[i][0].strip() if values[i] and values[i][0] else ''
-            if row_value == start_title:
-                start_row = i + 1
-                logger.info(f"Found existing report start for {today_date_str} at row {start_row}.")
-                break
-
-        if start_row is None:
+        # One vectorized pass over column A instead of stripping and comparing cell by cell. Rows come
+        # back as one-cell lists (empty for blank rows), which .str[0] unwraps without a Python loop
+        column_a = pd.Series(values, dtype=object).str[0].fillna('').astype('string').str.strip()
+        title_rows = column_a[column_a == start_title].index
+        if len(title_rows) == 0:
             logger.info(f"No existing report found for {today_date_str}.")
             return None, None
+        start_row = int(title_rows[0]) + 1
+        logger.info(f"Found existing report start for {today_date_str} at row {start_row}.")
 
-        for i in range(start_row, last_row_in_sheet + 1):
-            if i > last_row_in_sheet:
-                break
-            row_value = values[i-1][0].strip() if values[i-1] and values[i-1][0] else ''
-            if row_value.startswith(any_report_start_pattern) and i > start_row:
-                next_start_row = i
-                logger.debug(f"Found start of next report section at row {next_start_row}.")
-                break
+        # The series index is 0-based, so index >= start_row means sheet rows after the title row
+        next_title_rows = column_a[column_a.str.startswith(REPORT_TITLE_PREFIX) & (column_a.index >= start_row)].index
+        if len(next_title_rows) > 0:
+            next_start_row = int(next_title_rows[0]) + 1
+            logger.debug(f"Found start of next report section at row {next_start_row}.")
 
         end_row_to_clear = next_start_row - 1 if next_start_row else last_row_in_sheet
         end_row_to_clear = max(start_row, end_row_to_clear)
@@ -1058,8 +1166,57 @@ def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_d
         return None, None
 
 # --- Process Abandoned Orders Sheet ---
-def distribute_abandoned_orders(service, stakeholder_list, stakeholder_assignments, abandoned_spreadsheet_id, abandoned_sheet_name):
-    """Processes abandoned orders (blank, Didn't Pickup, Follow Up) with limits and returns report counts."""
+def read_abandoned_sheet(sheet, abandoned_spreadsheet_id, abandoned_sheet_name):
+    """Reads the abandoned sheet header and its mapped columns. Returns (header positions, DataFrame), or (None, None) without a header."""
+    header_row_number = ABANDONED_HEADER_ROW_INDEX + 1
+    logger.info(f"Reading header from abandoned sheet '{abandoned_sheet_name}' (row {header_row_number})...")
+    header_range = f'{abandoned_sheet_name}!A{header_row_number}:BH{header_row_number}'  # Keep slightly wider range
+    result = sheet.values().get(spreadsheetId=abandoned_spreadsheet_id, range=header_range, fields='values').execute(num_retries=API_NUM_RETRIES)
+    header_values = result.get('values', [])
+    if not header_values or not header_values[0]:
+        return None, None
+    header = [str(h).strip() if h is not None else '' for h in header_values[0]]
+    logger.info(f"Abandoned sheet header row (row {header_row_number}) with {len(header)} columns identified.")
+    header_positions = build_header_positions(header)
+
+    # Only the mapped columns are read, so the last row is the last one with a value in any of them.
+    # Blank-status rows are processed too, and cart_id/phone_number are what mark those rows; a cart
+    # with data only in other columns (A:BH used to be read in full) is not picked up
+    for col_key in ('cart_id', 'phone_number'):
+        if COL_NAMES_ABANDONED[col_key] not in header_positions:
+            logger.warning(f"Column '{COL_NAMES_ABANDONED[col_key]}' not found in abandoned sheet header. "
+                           "Trailing blank-status rows may not be detected.")
+    logger.info(f"Reading data from abandoned sheet '{abandoned_sheet_name}'...")
+    abandoned_df = read_sheet_columns(
+        sheet, abandoned_spreadsheet_id, abandoned_sheet_name, header_positions,
+        list(COL_NAMES_ABANDONED.values()), ABANDONED_DATA_START_ROW_INDEX
+    )
+    return header_positions, abandoned_df
+
+def read_abandoned_sheet_with_own_service(abandoned_spreadsheet_id, abandoned_sheet_name):
+    """Runs read_abandoned_sheet on its own service so it can be called from a worker thread."""
+    # googleapiclient services share one httplib2 connection and are not thread-safe.
+    # Returning None lets the caller fall back to reading with its own service.
+    service = authenticate_google_sheets()
+    if not service:
+        logger.warning("Could not build a separate service for the abandoned sheet read.")
+        return None
+    return read_abandoned_sheet(service.spreadsheets(), abandoned_spreadsheet_id, abandoned_sheet_name)
+
+def batch_update_with_own_service(spreadsheet_id, updates):
+    """Runs batch_update_in_chunks on its own service so it can be called from a worker thread."""
+    # Returning None lets the caller fall back to writing with its own service
+    service = authenticate_google_sheets()
+    if not service:
+        logger.warning("Could not build a separate service for the batch update.")
+        return None
+    return batch_update_in_chunks(service.spreadsheets(), spreadsheet_id, updates)
+
+def distribute_abandoned_orders(service, stakeholder_list, stakeholder_assignments, abandoned_spreadsheet_id, abandoned_sheet_name, sheet_data_future=None):
+    """Processes abandoned orders (blank, Didn't Pickup, Follow Up) with limits and returns report counts.
+
+    `sheet_data_future` may hold a read of the sheet already started in the background.
+    """
     logger.info("--- Starting Abandoned Orders Processing ---")
     sheet = service.spreadsheets()
     today_date_str_for_sheet = datetime.date.today().strftime("%d-%b-%Y")
@@ -1069,44 +1226,16 @@ def distribute_abandoned_orders(service, stakeholder_list, stakeholder_assignmen
 
     try:
         # Read data
-        logger.info(f"Reading data from abandoned sheet '{abandoned_sheet_name}'...")
-        read_range = f'{abandoned_sheet_name}!A:BH'  # Keep slightly wider range
-        result = sheet.values().get(spreadsheetId=abandoned_spreadsheet_id, range=read_range).execute()
-        values = result.get('values', [])
+        sheet_data = sheet_data_future.result() if sheet_data_future is not None else None  # Re-raises any API error from the read
+        if sheet_data is None:
+            sheet_data = read_abandoned_sheet(sheet, abandoned_spreadsheet_id, abandoned_sheet_name)
+        abandoned_header_positions, abandoned_df = sheet_data
 
-        if not values:
+        if abandoned_header_positions is None:
             logger.warning(f"No data found in abandoned sheet '{abandoned_sheet_name}'.")
             return abandoned_report_counts
 
-        logger.info(f"Successfully read {len(values)} rows from abandoned sheet.")
-
-        # Validate header row
-        if ABANDONED_HEADER_ROW_INDEX >= len(values):
-            logger.error(f"Abandoned sheet header index ({ABANDONED_HEADER_ROW_INDEX}) is out of bounds (total rows: {len(values)}).")
-            return abandoned_report_counts
-
-        abandoned_header = [str(h).strip() if h is not None else '' for h in values[ABANDONED_HEADER_ROW_INDEX]]
-        abandoned_header_length = len(abandoned_header)
-        logger.info(f"Abandoned sheet header row (row {ABANDONED_HEADER_ROW_INDEX + 1}) with {abandoned_header_length} columns identified.")
-
-        # Pad data rows
-        data_rows_raw = values[ABANDONED_DATA_START_ROW_INDEX:]
-        padded_data_rows = []
-        for i, row in enumerate(data_rows_raw):
-            processed_row = [str(cell).strip() if cell is not None else '' for cell in row]
-            if len(processed_row) < abandoned_header_length:
-                processed_row.extend([''] * (abandoned_header_length - len(processed_row)))
-            elif len(processed_row) > abandoned_header_length:
-                logger.warning(f"Abandoned sheet row {ABANDONED_DATA_START_ROW_INDEX + i + 1} has more columns ({len(processed_row)}) than header ({abandoned_header_length}). Truncating.")
-                processed_row = processed_row[:abandoned_header_length]
-            padded_data_rows.append(processed_row)
-
-        logger.info(f"Processed {len(padded_data_rows)} abandoned data rows.")
-
-        # Create DataFrame
-        abandoned_df = pd.DataFrame(padded_data_rows, columns=abandoned_header)
-        abandoned_df['_original_row_index'] = range(ABANDONED_DATA_START_ROW_INDEX + 1, ABANDONED_DATA_START_ROW_INDEX + 1 + len(abandoned_df))
-        logger.info(f"Created pandas DataFrame for abandoned data with {len(abandoned_df)} rows and {len(abandoned_df.columns)} columns.")
+        logger.info(f"Successfully read {len(abandoned_df)} data rows from abandoned sheet.")
 
         # Ensure required columns
         cols_needed = [
@@ -1117,19 +1246,22 @@ def distribute_abandoned_orders(service, stakeholder_list, stakeholder_assignmen
             COL_NAMES_ABANDONED['date_col_3']
         ]
         for col_name in cols_needed:
-            if col_name not in abandoned_df.columns:
+            if col_name not in abandoned_header_positions:
                 logger.warning(f"Column '{col_name}' not found in abandoned DataFrame. Adding it as empty.")
-                abandoned_df[col_name] = ''
-            abandoned_df[col_name] = abandoned_df[col_name].astype(str)  # Keep as string initially
 
-        # Clean calling status
-        abandoned_df[COL_NAMES_ABANDONED['calling_status']] = abandoned_df[COL_NAMES_ABANDONED['calling_status']].fillna('').astype(str).str.strip()
+        abandoned_df['_original_row_index'] = range(ABANDONED_DATA_START_ROW_INDEX + 1, ABANDONED_DATA_START_ROW_INDEX + 1 + len(abandoned_df))
+        logger.info(f"Created pandas DataFrame for abandoned data with {len(abandoned_df)} rows and {len(abandoned_df.columns)} columns.")
 
         # Filter rows where Call Status is blank, "Didn't Pickup", or "Follow Up"
         statuses_to_process = ['', "Didn't Pickup", "Follow Up"]
         logger.info(f"Filtering abandoned rows with Call Status in {statuses_to_process}...")
-        abandoned_to_process_df = abandoned_df[abandoned_df[COL_NAMES_ABANDONED['calling_status']].isin(statuses_to_process)].copy()
-        abandoned_filtered_indices = abandoned_to_process_df.index.tolist()
+        calling_status = abandoned_df[COL_NAMES_ABANDONED['calling_status']].fillna('').astype(STRING_DTYPE).str.strip()
+        # Only the matching rows are kept (with their original index), so the other working columns
+        # are cleaned for those rows alone
+        abandoned_df = abandoned_df[calling_status.isin(statuses_to_process)].copy()
+        for col_name in cols_needed:
+            abandoned_df[col_name] = abandoned_df[col_name].fillna('').astype(STRING_DTYPE).str.strip()
+        abandoned_filtered_indices = abandoned_df.index.tolist()
 
         logger.info(f"Found {len(abandoned_filtered_indices)} abandoned rows matching criteria: {statuses_to_process}.")
 
@@ -1139,77 +1271,52 @@ def distribute_abandoned_orders(service, stakeholder_list, stakeholder_assignmen
 
         # Assign stakeholders with limits and apply date logic
         logger.info(f"Assigning/Reassigning stakeholders to {len(abandoned_filtered_indices)} abandoned rows with limits...")
-        current_index = 0
-        assigned_count = 0
-        for df_index in abandoned_filtered_indices:
-            assigned_stakeholder, current_index = assign_stakeholder_with_limits(current_index, stakeholder_list, stakeholder_assignments)
-
-            if assigned_stakeholder is None:
-                logger.debug(f"Abandoned row {abandoned_df.loc[df_index, '_original_row_index']} not assigned/reassigned: all stakeholders at capacity.")
-                continue  # Skip to next row if no stakeholder available
-
-            assigned_count += 1
-            row_data = abandoned_df.loc[df_index]
-            original_sheet_row = row_data['_original_row_index']
-            call_status = row_data.get(COL_NAMES_ABANDONED['calling_status'], '').strip()
-            # Get original date values *before* potential updates
-            original_date1_val = str(row_data.get(COL_NAMES_ABANDONED['date_col_1'], '')).strip()
-            original_date2_val = str(row_data.get(COL_NAMES_ABANDONED['date_col_2'], '')).strip()
-            original_date3_val = str(row_data.get(COL_NAMES_ABANDONED['date_col_3'], '')).strip()
+        assigned_positions = build_assignment_schedule(stakeholder_list, stakeholder_assignments, len(abandoned_filtered_indices))
+        assigned_count = len(assigned_positions)
+        # The schedule covers the filtered rows in order; anything past its end stays as it is
+        assigned_df_indices = abandoned_filtered_indices[:assigned_count]
+        if assigned_count < len(abandoned_filtered_indices):
+            logger.info(f"{len(abandoned_filtered_indices) - assigned_count} abandoned rows not assigned/reassigned: all stakeholders at capacity.")
+
+        if assigned_count:
+            date_col_1 = COL_NAMES_ABANDONED['date_col_1']
+            date_col_2 = COL_NAMES_ABANDONED['date_col_2']
+            date_col_3 = COL_NAMES_ABANDONED['date_col_3']
 
             # --- Assign Stakeholder and Update Report Counts ---
-            abandoned_df.loc[df_index, COL_NAMES_ABANDONED['stakeholder']] = assigned_stakeholder
-            abandoned_report_counts[assigned_stakeholder]["Total"] += 1
-            abandoned_report_counts[assigned_stakeholder]["Abandoned"] += 1  # All processed count as Abandoned
+            assigned_index = pd.Index(assigned_df_indices)
+            stakeholder_names = np.array([stakeholder['name'] for stakeholder in stakeholder_list], dtype=object)
+            abandoned_df.loc[assigned_index, COL_NAMES_ABANDONED['stakeholder']] = stakeholder_names[assigned_positions]
+            # One tally per stakeholder position; every processed row counts as Abandoned, so no category axis is needed
+            assigned_per_stakeholder = np.bincount(assigned_positions, minlength=len(stakeholder_list))
+            for name, count in zip(stakeholder_names, assigned_per_stakeholder.tolist()):
+                abandoned_report_counts[name]["Total"] += count
+                abandoned_report_counts[name]["Abandoned"] += count
 
             # --- Date Logic ---
-            if call_status == '':
-                # For blank status, ALWAYS update Date 1 to today's date.
-                abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_1']] = today_date_str_for_sheet
-                # Clear Date 2 and Date 3 just in case they had spurious data for a blank status row
-                abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_2']] = ''
-                abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_3']] = ''
-
-                # Log appropriately based on whether Date 1 was overwritten
-                if not original_date1_val:
-                    logger.debug(f"Abandoned Row {original_sheet_row} (Blank Status): Assigned to {assigned_stakeholder}, set Date 1 to {today_date_str_for_sheet}.")
-                else:
-                    logger.debug(f"Abandoned Row {original_sheet_row} (Blank Status, existing Date 1 '{original_date1_val}'): Assigned to {assigned_stakeholder}, **overwrote** Date 1 with {today_date_str_for_sheet}.")
-
-            elif call_status in ["Didn't Pickup", "Follow Up"]:
-                # This is a reassignment for follow-up (multi-date logic)
-                if not original_date1_val:
-                    # If Date 1 is somehow blank, fill it first (unlikely flow)
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_1']] = today_date_str_for_sheet
-                    # Clear Date 2/3 if we are filling Date 1 here
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_2']] = ''
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_3']] = ''
-                    logger.warning(f"Abandoned Row {original_sheet_row} ('{call_status}') had no Date 1. Set Date 1 to {today_date_str_for_sheet}. Assigned to {assigned_stakeholder}.")
-                elif not original_date2_val:
-                    # Date 1 exists, fill Date 2 if empty
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_2']] = today_date_str_for_sheet
-                    # Keep Date 1 as is, clear Date 3
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_3']] = ''
-                    logger.debug(f"Abandoned Row {original_sheet_row} ('{call_status}', 2nd attempt): Reassigned to {assigned_stakeholder}, set Date 2 to {today_date_str_for_sheet}.")
-                elif not original_date3_val:
-                    # Date 1 and 2 exist, fill Date 3 if empty
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_3']] = today_date_str_for_sheet
-                    # Keep Date 1 and 2 as is
-                    logger.debug(f"Abandoned Row {original_sheet_row} ('{call_status}', 3rd attempt): Reassigned to {assigned_stakeholder}, set Date 3 to {today_date_str_for_sheet}.")
-                else:
-                    # All 3 dates already filled
-                    logger.debug(f"Abandoned Row {original_sheet_row} ('{call_status}'): Already has 3 dates filled. Reassigned to {assigned_stakeholder}, but no date column updated.")
-                    # Ensure DataFrame reflects original dates if no update happened
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_1']] = original_date1_val
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_2']] = original_date2_val
-                    abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_3']] = original_date3_val
-
-            else:
-                logger.error(f"Abandoned Row {original_sheet_row} has unexpected status '{call_status}' after filtering. Assigned to {assigned_stakeholder} but date logic skipped.")
-                # Ensure DataFrame reflects original dates if skipped
-                abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_1']] = original_date1_val
-                abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_2']] = original_date2_val
-                abandoned_df.loc[df_index, COL_NAMES_ABANDONED['date_col_3']] = original_date3_val
+            # Masks are built from the original values, before any of the writes below
+            assigned_rows = abandoned_df.loc[assigned_index]
+            call_status = assigned_rows[COL_NAMES_ABANDONED['calling_status']].to_numpy()
+            date1_empty = assigned_rows[date_col_1].to_numpy() == ''
+            date2_empty = assigned_rows[date_col_2].to_numpy() == ''
+            date3_empty = assigned_rows[date_col_3].to_numpy() == ''
+
+            # Blank status always (re)starts at Date 1. "Didn't Pickup"/"Follow Up" fill the first
+            # empty date; a missing Date 1 there is unexpected, so it restarts at Date 1 as well
+            is_blank = call_status == ''
+            missing_date1 = ~is_blank & date1_empty
+            set_date1 = is_blank | missing_date1
+            set_date2 = ~set_date1 & date2_empty
+            set_date3 = ~set_date1 & ~date2_empty & date3_empty
+
+            abandoned_df.loc[assigned_index[set_date1], [date_col_1, date_col_2, date_col_3]] = [today_date_str_for_sheet, '', '']
+            abandoned_df.loc[assigned_index[set_date2], [date_col_2, date_col_3]] = [today_date_str_for_sheet, '']
+            abandoned_df.loc[assigned_index[set_date3], date_col_3] = today_date_str_for_sheet
+
+            if missing_date1.any():
+                logger.warning(f"{int(missing_date1.sum())} abandoned rows with status \"Didn't Pickup\"/\"Follow Up\" had no Date 1. Set Date 1 to {today_date_str_for_sheet}.")
+            logger.debug(f"Abandoned date updates: {int(set_date1.sum())} Date 1, {int(set_date2.sum())} Date 2, {int(set_date3.sum())} Date 3, "
+                         f"{int((~set_date1 & ~set_date2 & ~set_date3).sum())} already had 3 dates filled.")
 
         logger.info(f"Stakeholders assigned/reassigned to {assigned_count} abandoned rows.")
 
@@ -1222,38 +1329,38 @@ def distribute_abandoned_orders(service, stakeholder_list, stakeholder_assignmen
             COL_NAMES_ABANDONED['date_col_2'],
             COL_NAMES_ABANDONED['date_col_3']
         ]
-        sheet_col_indices_abandoned = {}
+        write_columns_abandoned = []  # (column name, sheet column index) for each writeable column
         max_col_index_to_write_abandoned = -1
 
         for col_name in cols_to_update_names_abandoned:
-            try:
-                col_index = abandoned_header.index(col_name)
-                sheet_col_indices_abandoned[col_name] = col_index
-                max_col_index_to_write_abandoned = max(max_col_index_to_write_abandoned, col_index)
-                logger.debug(f"Found column '{col_name}' at index {col_index} in abandoned sheet header.")
-            except ValueError:
+            col_index = abandoned_header_positions.get(col_name, -1)
+            if col_index == -1:
                 logger.warning(f"Column '{col_name}' not found in abandoned sheet header. Cannot write to this column.")
-                sheet_col_indices_abandoned[col_name] = -1
+                continue
+            write_columns_abandoned.append((col_name, col_index))
+            max_col_index_to_write_abandoned = max(max_col_index_to_write_abandoned, col_index)
+            logger.debug(f"Found column '{col_name}' at index {col_index} in abandoned sheet header.")
 
         if max_col_index_to_write_abandoned != -1:
-            assigned_indices = [idx for idx in abandoned_filtered_indices if not pd.isna(abandoned_df.loc[idx, COL_NAMES_ABANDONED['stakeholder']]) and abandoned_df.loc[idx, COL_NAMES_ABANDONED['stakeholder']] != '']
-
-            for df_index in assigned_indices:
-                original_sheet_row = abandoned_df.loc[df_index, '_original_row_index']
-                row_values_to_write = [None] * (max_col_index_to_write_abandoned + 1)
-
-                for col_name in cols_to_update_names_abandoned:
-                    col_idx = sheet_col_indices_abandoned.get(col_name, -1)
-                    if col_idx != -1:
-                        value_to_write = abandoned_df.loc[df_index, col_name]
-                        # Write blank string for empty/None values to clear cells if needed
-                        row_values_to_write[col_idx] = value_to_write if pd.notna(value_to_write) else ''
-
-                if any(val is not None for val in row_values_to_write):
-                    abandoned_updates.append({
-                        'range': f'{abandoned_sheet_name}!A{original_sheet_row}:{col_index_to_a1(max_col_index_to_write_abandoned)}{original_sheet_row}',
-                        'values': [row_values_to_write]
-                    })
+            # Every filtered row that ends up with a stakeholder is written, including ones left with
+            # their previous stakeholder because everyone was at capacity
+            filtered_rows = abandoned_df.loc[abandoned_filtered_indices]
+            rows_to_write = filtered_rows[filtered_rows[COL_NAMES_ABANDONED['stakeholder']] != '']
+            sheet_rows = rows_to_write['_original_row_index'].tolist()
+            row_runs = group_contiguous_rows(sheet_rows)
+
+            # One narrow range per written column and run of consecutive rows, instead of a row padded
+            # with None from column A up to the last written column
+            for col_name, col_idx in write_columns_abandoned:
+                col_letter = col_index_to_a1(col_idx)
+                col_values = rows_to_write[col_name].tolist()
+                abandoned_updates.extend(
+                    {
+                        'range': f'{abandoned_sheet_name}!{col_letter}{sheet_rows[run_start]}:{col_letter}{sheet_rows[run_end]}',
+                        'values': [[value] for value in col_values[run_start:run_end + 1]]
+                    }
+                    for run_start, run_end in row_runs
+                )
 
             logger.info(f"Prepared {len(abandoned_updates)} row updates for Abandoned sheet batch write.")
         else:
@@ -1262,11 +1369,9 @@ def distribute_abandoned_orders(service, stakeholder_list, stakeholder_assignmen
         # Execute batch update
         if abandoned_updates:
             logger.info("Executing batch update to Abandoned sheet...")
-            body = {'value_input_option': 'RAW', 'data': abandoned_updates}
             try:
-                result = sheet.values().batchUpdate(
-                    spreadsheetId=abandoned_spreadsheet_id, body=body).execute()
-                logger.info(f"Abandoned sheet batch update completed. {result.get('totalUpdatedCells', 'N/A')} cells updated.")
+                updated_cells = batch_update_in_chunks(sheet, abandoned_spreadsheet_id, abandoned_updates)
+                logger.info(f"Abandoned sheet batch update completed. {updated_cells} cells updated.")
             except HttpError as e:
                 logger.error(f"API Error during abandoned sheet batch update: {e}")
             except Exception as e:
@@ -1312,11 +1417,13 @@ def distribute_and_report():
         return
     sheet = service.spreadsheets()
 
-    # Initialize combined report counts
-    combined_report_counts = {
-        name: {"Total": 0, "Fresh": 0, "Abandoned": 0, "Invalid/Fake": 0, "CNP": 0, "Follow up": 0, "NDR": 0}
-        for name in stakeholder_names
-    }
+    # The abandoned sheet is in a different spreadsheet and its contents don't depend on the Orders
+    # pass, so read it in the background while the Orders sheet is read and processed
+    abandoned_read_executor = ThreadPoolExecutor(max_workers=1)
+    abandoned_data_future = abandoned_read_executor.submit(
+        read_abandoned_sheet_with_own_service, ABANDONED_SPREADSHEET_ID, ABANDONED_SHEET_NAME
+    )
+    abandoned_read_executor.shutdown(wait=False)
 
     # --- Process Main Orders Sheet ---
     logger.info("--- Starting Main Orders Processing ---")
@@ -1328,169 +1435,177 @@ def distribute_and_report():
         for name in stakeholder_names
     }
 
+    # Column A of the report sheet, fetched together with the Orders data (None if it could not be)
+    report_column_values = None
+    # Background write of the Orders updates (None if there is nothing to write)
+    orders_update_future = None
+
     try:
-        # Read data
-        logger.info(f"Reading data from '{ORDERS_SHEET_NAME}'...")
-        read_range = f'{ORDERS_SHEET_NAME}!A:BD'
-        result = sheet.values().get(spreadsheetId=ORDERS_SPREADSHEET_ID, range=read_range).execute()
-        values = result.get('values', [])
+        # Read header. The report sheet lives in the same spreadsheet, so its column A (needed later to
+        # locate today's report) comes back in the same batchGet round trip as the Orders header
+        header_row_number = ORDERS_HEADER_ROW_INDEX + 1
+        logger.info(f"Reading header from '{ORDERS_SHEET_NAME}' (row {header_row_number})...")
+        header_range = f'{ORDERS_SHEET_NAME}!A{header_row_number}:BD{header_row_number}'
+        try:
+            result = sheet.values().batchGet(
+                spreadsheetId=ORDERS_SPREADSHEET_ID,
+                ranges=[header_range, f'{REPORT_SHEET_NAME}!A:A'],
+                fields='valueRanges(range,values)'
+            ).execute(num_retries=API_NUM_RETRIES)
+            header_value_range, report_value_range = result.get('valueRanges', [])
+            header_values = header_value_range.get('values', [])
+            report_column_values = report_value_range.get('values', [])
+        except HttpError as e:
+            if e.resp.status != 400:
+                raise
+            # One unknown range (usually a report sheet that doesn't exist yet) fails the whole batch
+            logger.info(f"Combined read failed ({e}). Reading the '{ORDERS_SHEET_NAME}' header on its own...")
+            result = sheet.values().get(spreadsheetId=ORDERS_SPREADSHEET_ID, range=header_range, fields='values').execute(num_retries=API_NUM_RETRIES)
+            header_values = result.get('values', [])
 
-        if not values:
-            logger.warning(f"No data found in '{ORDERS_SHEET_NAME}'.")
+        if not header_values or not header_values[0]:
+            logger.warning(f"No header found in '{ORDERS_SHEET_NAME}' (row {header_row_number}).")
         else:
-            logger.info(f"Read {len(values)} rows from '{ORDERS_SHEET_NAME}'.")
+            header = [str(h).strip() if h is not None else '' for h in header_values[0]]
+            header_length = len(header)
+            header_positions = build_header_positions(header)
+            logger.info(f"Orders sheet header row (row {header_row_number}) with {header_length} columns identified.")
+
+            # Ensure required columns
+            cols_needed_orders = [
+                COL_NAMES_ORDERS['call_status'],
+                COL_NAMES_ORDERS['stakeholder'],
+                COL_NAMES_ORDERS['date_col_1'],
+                COL_NAMES_ORDERS['date_col_2'],
+                COL_NAMES_ORDERS['date_col_3']
+            ]
+            for col_name in cols_needed_orders:
+                if col_name not in header_positions:
+                    logger.warning(f"Column '{col_name}' not found in Orders DataFrame. Adding it as empty.")
+
+            # Read data. Only the columns the script uses are fetched; rows with no status are never
+            # processed, so nothing is lost by stopping at the last row these columns have a value in
+            logger.info(f"Reading data from '{ORDERS_SHEET_NAME}'...")
+            df = read_sheet_columns(sheet, ORDERS_SPREADSHEET_ID, ORDERS_SHEET_NAME, header_positions, cols_needed_orders, ORDERS_DATA_START_ROW_INDEX)
+            df['_original_row_index'] = range(ORDERS_DATA_START_ROW_INDEX + 1, ORDERS_DATA_START_ROW_INDEX + 1 + len(df))
+            logger.info(f"Created pandas DataFrame for Orders data with {len(df)} rows and {len(df.columns)} columns.")
+
+            # Filter rows for processing. Only the status column is normalized for every row; the other
+            # working columns are normalized once, for the matching rows (kept with their original index)
+            logger.info("Filtering Orders rows based on priority statuses...")
+            all_priority_statuses = [status for priority_list in CALL_PRIORITIES.values() for status in priority_list]
+            df[COL_NAMES_ORDERS['call_status']] = df[COL_NAMES_ORDERS['call_status']].fillna('').astype(STRING_DTYPE).str.strip()
+            df = df[df[COL_NAMES_ORDERS['call_status']].isin(all_priority_statuses)].copy()
+            for col_name in cols_needed_orders:
+                if col_name != COL_NAMES_ORDERS['call_status']:
+                    df[col_name] = df[col_name].fillna('').astype(STRING_DTYPE).str.strip()
+            orders_filtered_indices = df.index.tolist()
+
+            logger.info(f"Found {len(orders_filtered_indices)} Orders rows matching priority statuses.")
+
+            # Assign stakeholders and dates
+            if orders_filtered_indices:
+                logger.info(f"Assigning stakeholders to {len(orders_filtered_indices)} Orders rows with limits...")
+                assigned_positions = build_assignment_schedule(stakeholder_list, stakeholder_assignments, len(orders_filtered_indices))
+                # The schedule covers the filtered rows in order; anything past its end stays unassigned
+                assigned_index = pd.Index(orders_filtered_indices[:len(assigned_positions)])
+                if len(assigned_index) < len(orders_filtered_indices):
+                    logger.info(f"{len(orders_filtered_indices) - len(assigned_index)} Orders rows not assigned: all stakeholders at capacity.")
+                df.loc[assigned_index, COL_NAMES_ORDERS['stakeholder']] = np.array(stakeholder_names, dtype=object)[assigned_positions]
+                assigned_rows = df.loc[assigned_index]
+
+                # Update report counts: one stakeholder x category table for all assigned rows
+                assigned_stakeholders = assigned_rows[COL_NAMES_ORDERS['stakeholder']]
+                report_categories = assigned_rows[COL_NAMES_ORDERS['call_status']].astype(STATUS_CATEGORICAL_DTYPE).map(STATUS_TO_REPORT_CATEGORY)
+                for call_status in assigned_rows.loc[report_categories.isna(), COL_NAMES_ORDERS['call_status']].unique():
+                    logger.warning(f"Report category for status '{call_status}' not found.")
+                category_counts = pd.crosstab(assigned_stakeholders, report_categories)
+                for name, count in assigned_stakeholders.value_counts().items():
+                    orders_report_counts[name]["Total"] += int(count)
+                for (name, category), count in category_counts.stack().items():
+                    orders_report_counts[name][category] += int(count)
+
+                # Date logic. Masks are built from the original values, before any of the writes below
+                date_col_1 = COL_NAMES_ORDERS['date_col_1']
+                date_col_2 = COL_NAMES_ORDERS['date_col_2']
+                date_col_3 = COL_NAMES_ORDERS['date_col_3']
+                is_cnp = assigned_rows[COL_NAMES_ORDERS['call_status']].to_numpy() == "Call didn't Pick"
+                date1_empty = assigned_rows[date_col_1].to_numpy() == ''
+                date2_empty = assigned_rows[date_col_2].to_numpy() == ''
+                date3_empty = assigned_rows[date_col_3].to_numpy() == ''
+
+                # "Call didn't Pick" fills the first empty date; every other status sets Date to today
+                set_date1 = ~is_cnp | date1_empty
+                set_date2 = is_cnp & ~date1_empty & date2_empty
+                set_date3 = is_cnp & ~date1_empty & ~date2_empty & date3_empty
+
+                df.loc[assigned_index[set_date1], date_col_1] = today_date_str_for_sheet
+                df.loc[assigned_index[set_date2], date_col_2] = today_date_str_for_sheet
+                df.loc[assigned_index[set_date3], date_col_3] = today_date_str_for_sheet
+                logger.debug(f"Orders date updates: {int(set_date1.sum())} Date, {int(set_date2.sum())} Date 2, {int(set_date3.sum())} Date 3, "
+                             f"{int((~set_date1 & ~set_date2 & ~set_date3).sum())} CNP rows already had 3 dates filled.")
+
+                logger.info(f"Date logic and report counts applied to {len(assigned_index)} Orders rows.")
+
+            # Prepare batch update
+            logger.info("Preparing batch update for Orders sheet...")
+            orders_updates = []
+            cols_to_update_names_orders = [
+                COL_NAMES_ORDERS['stakeholder'],
+                COL_NAMES_ORDERS['date_col_1'],
+                COL_NAMES_ORDERS['date_col_2'],
+                COL_NAMES_ORDERS['date_col_3']
+            ]
+            write_columns_orders = []  # (column name, sheet column index) for each writeable column
+            max_col_index_to_write_orders = -1
+
+            for col_name in cols_to_update_names_orders:
+                col_index = header_positions.get(col_name, -1)
+                if col_index == -1:
+                    logger.warning(f"Column '{col_name}' not found in Orders sheet header. Cannot write to this column.")
+                    continue
+                write_columns_orders.append((col_name, col_index))
+                max_col_index_to_write_orders = max(max_col_index_to_write_orders, col_index)
+                logger.debug(f"Found column '{col_name}' at index {col_index} in Orders sheet header.")
+
+            if max_col_index_to_write_orders != -1:
+                # Each update spans only the columns from the first to the last writeable one
+                min_col_index_to_write_orders = min(col_idx for _, col_idx in write_columns_orders)
+                first_col_letter_orders = col_index_to_a1(min_col_index_to_write_orders)
+                filtered_rows = df.loc[orders_filtered_indices]
+                rows_to_write = filtered_rows[filtered_rows[COL_NAMES_ORDERS['stakeholder']].to_numpy() != '']
+                # One None-padded row per update, filled column-wise in a single object array
+                row_values_to_write = np.full((len(rows_to_write), max_col_index_to_write_orders - min_col_index_to_write_orders + 1), None, dtype=object)
+                row_values_to_write[:, [col_idx - min_col_index_to_write_orders for _, col_idx in write_columns_orders]] = (
+                    rows_to_write[[col_name for col_name, _ in write_columns_orders]].to_numpy(dtype=object)
+                )
+                # Runs of consecutive sheet rows go out as one block range each
+                sheet_rows = rows_to_write['_original_row_index'].tolist()
+                last_col_letter_orders = col_index_to_a1(max_col_index_to_write_orders)
+                row_values_list = row_values_to_write.tolist()
+                orders_updates = [
+                    {
+                        'range': f'{ORDERS_SHEET_NAME}!{first_col_letter_orders}{sheet_rows[run_start]}:{last_col_letter_orders}{sheet_rows[run_end]}',
+                        'values': row_values_list[run_start:run_end + 1]
+                    }
+                    for run_start, run_end in group_contiguous_rows(sheet_rows)
+                ]
 
-            if len(values) < ORDERS_DATA_START_ROW_INDEX + 1:
-                logger.error(f"Not enough rows in '{ORDERS_SHEET_NAME}'. Need at least {ORDERS_DATA_START_ROW_INDEX + 1} rows.")
-            elif ORDERS_HEADER_ROW_INDEX >= len(values):
-                logger.error(f"Orders sheet header index ({ORDERS_HEADER_ROW_INDEX}) is out of bounds (total rows: {len(values)}).")
+                logger.info(f"Prepared {len(orders_updates)} range updates covering {len(sheet_rows)} rows for Orders sheet batch write.")
             else:
-                header = [str(h).strip() if h is not None else '' for h in values[ORDERS_HEADER_ROW_INDEX]]
-                header_length = len(header)
-                logger.info(f"Orders sheet header row (row {ORDERS_HEADER_ROW_INDEX + 1}) with {header_length} columns identified.")
-
-                # Pad data rows
-                data_rows_raw = values[ORDERS_DATA_START_ROW_INDEX:]
-                padded_data_rows = []
-                for i, row in enumerate(data_rows_raw):
-                    processed_row = [str(cell).strip() if cell is not None else '' for cell in row]
-                    if len(processed_row) < header_length:
-                        processed_row.extend([''] * (header_length - len(processed_row)))
-                    elif len(processed_row) > header_length:
-                        logger.warning(f"Orders Row {ORDERS_DATA_START_ROW_INDEX + i + 1} has more columns ({len(processed_row)}) than header ({header_length}). Truncating.")
-                        processed_row = processed_row[:header_length]
-                    padded_data_rows.append(processed_row)
-
-                logger.info(f"Processed {len(padded_data_rows)} Orders data rows.")
-
-                # Create DataFrame
-                df = pd.DataFrame(padded_data_rows, columns=header)
-                df['_original_row_index'] = range(ORDERS_DATA_START_ROW_INDEX + 1, ORDERS_DATA_START_ROW_INDEX + 1 + len(df))
-                logger.info(f"Created pandas DataFrame for Orders data with {len(df)} rows and {len(df.columns)} columns.")
-
-                # Ensure required columns
-                cols_needed_orders = [
-                    COL_NAMES_ORDERS['call_status'],
-                    COL_NAMES_ORDERS['stakeholder'],
-                    COL_NAMES_ORDERS['date_col_1'],
-                    COL_NAMES_ORDERS['date_col_2'],
-                    COL_NAMES_ORDERS['date_col_3']
-                ]
-                for col_name in cols_needed_orders:
-                    if col_name not in df.columns:
-                        logger.warning(f"Column '{col_name}' not found in Orders DataFrame. Adding it as empty.")
-                        df[col_name] = ''
-                    df[col_name] = df[col_name].astype(str)
-
-                # Clean status column
-                df[COL_NAMES_ORDERS['call_status']] = df[COL_NAMES_ORDERS['call_status']].fillna('').astype(str).str.strip()
-
-                # Filter rows for processing
-                logger.info("Filtering Orders rows based on priority statuses...")
-                all_priority_statuses = [status for priority_list in CALL_PRIORITIES.values() for status in priority_list]
-                orders_to_process_df = df[df[COL_NAMES_ORDERS['call_status']].isin(all_priority_statuses)].copy()
-                orders_filtered_indices = orders_to_process_df.index.tolist()
-
-                logger.info(f"Found {len(orders_filtered_indices)} Orders rows matching priority statuses.")
-
-                # Assign stakeholders and dates
-                if orders_filtered_indices:
-                    logger.info(f"Assigning stakeholders to {len(orders_filtered_indices)} Orders rows with limits...")
-                    current_index = 0
-                    assigned_orders_processed_count = 0
-                    for df_index in orders_filtered_indices:
-                        assigned_stakeholder, current_index = assign_stakeholder_with_limits(current_index, stakeholder_list, stakeholder_assignments)
-                        if assigned_stakeholder is None:
-                            logger.debug(f"Orders row {df.loc[df_index, '_original_row_index']} not assigned: all stakeholders at capacity.")
-                            continue
-                        row_data = df.loc[df_index]
-                        df.loc[df_index, COL_NAMES_ORDERS['stakeholder']] = assigned_stakeholder
-                        call_status = row_data.get(COL_NAMES_ORDERS['call_status'], '').strip()
-                        date1_val = str(row_data.get(COL_NAMES_ORDERS['date_col_1'], '')).strip()
-                        date2_val = str(row_data.get(COL_NAMES_ORDERS['date_col_2'], '')).strip()
-                        date3_val = str(row_data.get(COL_NAMES_ORDERS['date_col_3'], '')).strip()
-
-                        # Update report counts
-                        assigned_orders_processed_count += 1
-                        orders_report_counts[assigned_stakeholder]["Total"] += 1
-                        report_category = STATUS_TO_REPORT_CATEGORY.get(call_status)
-                        if report_category in orders_report_counts[assigned_stakeholder]:
-                            orders_report_counts[assigned_stakeholder][report_category] += 1
-                        else:
-                            logger.warning(f"Report category '{report_category}' for status '{call_status}' not found.")
-
-                        # Date logic
-                        if call_status == "Call didn't Pick":
-                            if not date1_val:
-                                df.loc[df_index, COL_NAMES_ORDERS['date_col_1']] = today_date_str_for_sheet
-                                logger.debug(f"Orders Row {row_data['_original_row_index']}: CNP, 1st attempt. Set Date to {today_date_str_for_sheet}.")
-                            elif not date2_val:
-                                df.loc[df_index, COL_NAMES_ORDERS['date_col_2']] = today_date_str_for_sheet
-                                logger.debug(f"Orders Row {row_data['_original_row_index']}: CNP, 2nd attempt. Set Date 2 to {today_date_str_for_sheet}.")
-                            elif not date3_val:
-                                df.loc[df_index, COL_NAMES_ORDERS['date_col_3']] = today_date_str_for_sheet
-                                logger.debug(f"Orders Row {row_data['_original_row_index']}: CNP, 3rd attempt. Set Date 3 to {today_date_str_for_sheet}.")
-                            else:
-                                logger.debug(f"Orders Row {row_data['_original_row_index']}: CNP, 3 attempts already logged. Dates unchanged.")
-                        else:
-                            df.loc[df_index, COL_NAMES_ORDERS['date_col_1']] = today_date_str_for_sheet
-                            logger.debug(f"Orders Row {row_data['_original_row_index']}: Status '{call_status}'. Set Date to {today_date_str_for_sheet}.")
-
-                    logger.info(f"Date logic and report counts applied to {assigned_orders_processed_count} Orders rows.")
-
-                # Prepare batch update
-                logger.info("Preparing batch update for Orders sheet...")
-                orders_updates = []
-                cols_to_update_names_orders = [
-                    COL_NAMES_ORDERS['stakeholder'],
-                    COL_NAMES_ORDERS['date_col_1'],
-                    COL_NAMES_ORDERS['date_col_2'],
-                    COL_NAMES_ORDERS['date_col_3']
-                ]
-                sheet_col_indices_orders = {}
-                max_col_index_to_write_orders = -1
-
-                for col_name in cols_to_update_names_orders:
-                    try:
-                        col_index = header.index(col_name)
-                        sheet_col_indices_orders[col_name] = col_index
-                        max_col_index_to_write_orders = max(max_col_index_to_write_orders, col_index)
-                        logger.debug(f"Found column '{col_name}' at index {col_index} in Orders sheet header.")
-                    except ValueError:
-                        logger.warning(f"Column '{col_name}' not found in Orders sheet header. Cannot write to this column.")
-                        sheet_col_indices_orders[col_name] = -1
-
-                if max_col_index_to_write_orders != -1:
-                    for df_index in orders_filtered_indices:
-                        if df.loc[df_index, COL_NAMES_ORDERS['stakeholder']]:
-                            original_sheet_row = df.loc[df_index, '_original_row_index']
-                            row_values_to_write = [None] * (max_col_index_to_write_orders + 1)
-                            for col_name in cols_to_update_names_orders:
-                                if sheet_col_indices_orders.get(col_name, -1) != -1:
-                                    row_values_to_write[sheet_col_indices_orders[col_name]] = df.loc[df_index, col_name]
-                            orders_updates.append({
-                                'range': f'{ORDERS_SHEET_NAME}!A{original_sheet_row}',
-                                'values': [row_values_to_write]
-                            })
-
-                    logger.info(f"Prepared {len(orders_updates)} row updates for Orders sheet batch write.")
-                else:
-                    logger.warning("No writeable columns found in Orders header. No updates prepared.")
-
-                # Execute batch update
-                if orders_updates:
-                    logger.info("Executing batch update to Orders sheet...")
-                    body = {'value_input_option': 'RAW', 'data': orders_updates}
-                    try:
-                        result = sheet.values().batchUpdate(
-                            spreadsheetId=ORDERS_SPREADSHEET_ID, body=body).execute()
-                        logger.info(f"Orders sheet batch update completed. {result.get('totalUpdatedCells', 'N/A')} cells updated.")
-                    except HttpError as e:
-                        logger.error(f"API Error during Orders sheet batch update: {e}")
-                    except Exception as e:
-                        logger.exception("Unexpected error during Orders sheet batch update:")
-                else:
-                    logger.info("No updates to write back to Orders sheet.")
+                logger.warning("No writeable columns found in Orders header. No updates prepared.")
+
+            # Execute batch update. The abandoned pass only needs the assignment counts, which are final
+            # by now, so the write runs in the background while that pass reads and processes its sheet
+            if orders_updates:
+                logger.info("Executing batch update to Orders sheet in the background...")
+                orders_update_executor = ThreadPoolExecutor(max_workers=1)
+                orders_update_future = orders_update_executor.submit(
+                    batch_update_with_own_service, ORDERS_SPREADSHEET_ID, orders_updates
+                )
+                orders_update_executor.shutdown(wait=False)
+            else:
+                logger.info("No updates to write back to Orders sheet.")
 
         logger.info("--- Finished Main Orders Processing ---")
 
@@ -1500,34 +1615,47 @@ def distribute_and_report():
         logger.exception("Unexpected error during main Orders execution:")
 
     # --- Process Abandoned Orders Sheet ---
-    abandoned_report_counts = distribute_abandoned_orders(service, stakeholder_list, stakeholder_assignments, ABANDONED_SPREADSHEET_ID, ABANDONED_SHEET_NAME)
+    abandoned_report_counts = distribute_abandoned_orders(
+        service, stakeholder_list, stakeholder_assignments, ABANDONED_SPREADSHEET_ID, ABANDONED_SHEET_NAME,
+        sheet_data_future=abandoned_data_future
+    )
+
+    # --- Finish Orders Sheet Batch Update ---
+    if orders_update_future is not None:
+        try:
+            updated_cells = orders_update_future.result()
+            if updated_cells is None:
+                logger.info("Writing Orders sheet updates with the main service instead...")
+                updated_cells = batch_update_in_chunks(sheet, ORDERS_SPREADSHEET_ID, orders_updates)
+            logger.info(f"Orders sheet batch update completed. {updated_cells} cells updated.")
+        except HttpError as e:
+            logger.error(f"API Error during Orders sheet batch update: {e}")
+        except Exception as e:
+            logger.exception("Unexpected error during Orders sheet batch update:")
 
     # --- Combine Report Counts ---
     logger.info("Combining report counts from Orders and Abandoned sheets...")
-    for name in stakeholder_names:
-        combined_report_counts[name]["Total"] = (
-            orders_report_counts[name]["Total"] + abandoned_report_counts[name]["Total"]
-        )
-        for category in ["Fresh", "Abandoned", "Invalid/Fake", "CNP", "Follow up", "NDR"]:
-            combined_report_counts[name][category] = (
-                orders_report_counts[name].get(category, 0) +
-                abandoned_report_counts[name].get(category, 0)
-            )
+    report_category_order = ["Fresh", "Abandoned", "Invalid/Fake", "CNP", "Follow up", "NDR"]
+    # Stakeholders x categories; a category missing from one side counts as 0 there
+    combined_report_counts = (
+        pd.DataFrame.from_dict(orders_report_counts, orient='index')
+        .add(pd.DataFrame.from_dict(abandoned_report_counts, orient='index'), fill_value=0)
+        .reindex(index=stakeholder_names, columns=["Total"] + report_category_order, fill_value=0)
+        .astype(int)
+    )
     logger.info("Report counts combined.")
 
     # --- Generate Combined Stakeholder Report ---
     logger.info("Generating Combined Stakeholder Report...")
     formatted_report_values = []
-    formatted_report_values.append([f"--- Stakeholder Report for Assignments on {today_date_str_for_report} ---"])
+    formatted_report_values.append([f"{REPORT_TITLE_PREFIX}{today_date_str_for_report}{REPORT_TITLE_SUFFIX}"])
     formatted_report_values.append([''])
 
-    report_category_order = ["Fresh", "Abandoned", "Invalid/Fake", "CNP", "Follow up", "NDR"]
-
-    for stakeholder in stakeholder_names:
+    for stakeholder, stakeholder_counts in combined_report_counts.iterrows():
         formatted_report_values.append([f"Calls assigned {stakeholder}"])
-        formatted_report_values.append([f"- Total Calls This Run - {combined_report_counts[stakeholder]['Total']}"])
+        formatted_report_values.append([f"- Total Calls This Run - {stakeholder_counts['Total']}"])
         for category in report_category_order:
-            formatted_report_values.append([f"- {category} - {combined_report_counts[stakeholder][category]}"])
+            formatted_report_values.append([f"- {category} - {stakeholder_counts[category]}"])
         formatted_report_values.append([''])
 
     formatted_report_values.append(['--- End of Report for ' + today_date_str_for_report + ' ---'])
@@ -1536,7 +1664,7 @@ def distribute_and_report():
     # --- Write Report ---
     logger.info(f"Writing report to '{REPORT_SHEET_NAME}'...")
     start_row_existing, end_row_existing = find_existing_report_range(
-        sheet, ORDERS_SPREADSHEET_ID, REPORT_SHEET_NAME, today_date_str_for_report
+        sheet, ORDERS_SPREADSHEET_ID, REPORT_SHEET_NAME, today_date_str_for_report, report_column_values
     )
 
     if start_row_existing is not None and end_row_existing is not None:
@@ -1545,13 +1673,13 @@ def distribute_and_report():
         range_to_write_new = f'{REPORT_SHEET_NAME}!A{start_row_existing}'
         try:
             logger.info(f"Clearing range: {range_to_clear}")
-            sheet.values().clear(spreadsheetId=ORDERS_SPREADSHEET_ID, range=range_to_clear).execute()
+            sheet.values().clear(spreadsheetId=ORDERS_SPREADSHEET_ID, range=range_to_clear, fields='clearedRange').execute(num_retries=API_NUM_RETRIES)
             logger.info("Cleared old report data.")
             logger.info(f"Writing new report data to range: {range_to_write_new}")
             body = {'values': formatted_report_values}
             result = sheet.values().update(
                 spreadsheetId=ORDERS_SPREADSHEET_ID, range=range_to_write_new,
-                valueInputOption='RAW', body=body).execute()
+                valueInputOption='RAW', body=body, fields='updatedCells').execute(num_retries=API_NUM_RETRIES)
             logger.info(f"Report updated. {result.get('updatedCells', 'N/A')} cells updated.")
         except HttpError as e:
             logger.error(f"API Error while updating report: {e}")
@@ -1561,8 +1689,11 @@ def distribute_and_report():
         logger.info(f"No existing report for {today_date_str_for_report}. Appending new report...")
         start_row_for_append = 1
         try:
-            result_existing_report = sheet.values().get(spreadsheetId=ORDERS_SPREADSHEET_ID, range=f'{REPORT_SHEET_NAME}!A:A').execute()
-            existing_values = result_existing_report.get('values', [])
+            if report_column_values is not None:
+                existing_values = report_column_values
+            else:
+                result_existing_report = sheet.values().get(spreadsheetId=ORDERS_SPREADSHEET_ID, range=f'{REPORT_SHEET_NAME}!A:A', fields='values').execute(num_retries=API_NUM_RETRIES)
+                existing_values = result_existing_report.get('values', [])
             if existing_values:
                 start_row_for_append = len(existing_values) + 1
             logger.info(f"Found {len(existing_values)} existing rows. New report starts at row {start_row_for_append}.")
@@ -1571,7 +1702,7 @@ def distribute_and_report():
                 logger.warning(f"Sheet '{REPORT_SHEET_NAME}' not found. Creating it.")
                 try:
                     body = {'requests': [{'addSheet': {'properties': {'title': REPORT_SHEET_NAME}}}]}
-                    sheet.batchUpdate(spreadsheetId=ORDERS_SPREADSHEET_ID, body=body).execute()
+                    sheet.batchUpdate(spreadsheetId=ORDERS_SPREADSHEET_ID, body=body, fields='spreadsheetId').execute()  # Not retried: addSheet isn't idempotent
                     logger.info(f"Created sheet '{REPORT_SHEET_NAME}'. Report starts at row {start_row_for_append}.")
                 except Exception as create_err:
                     logger.error(f"Error creating sheet '{REPORT_SHEET_NAME}': {create_err}")
@@ -1590,7 +1721,7 @@ def distribute_and_report():
             try:
                 result = sheet.values().update(
                     spreadsheetId=ORDERS_SPREADSHEET_ID, range=range_to_write_report,
-                    valueInputOption='RAW', body=body).execute()
+                    valueInputOption='RAW', body=body, fields='updatedCells').execute(num_retries=API_NUM_RETRIES)
                 logger.info(f"Report written. {result.get('updatedCells', 'N/A')} cells updated.")
             except HttpError as e:
                 logger.error(f"API Error while writing report: {e}")
@@ -370,14 +370,15 @@
 
 import os.path
 import pandas as pd
+import numpy as np
 import logging
 import sys
 import yaml
-import streamlit as st
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.auth.exceptions import RefreshError
+from settings_io import read_settings_cached
 
 # --- Configuration ---
 # Settings File
@@ -426,8 +427,7 @@ def load_settings(filename):
     """Loads configuration from a YAML file."""
     logger.info(f"Loading settings from '{filename}'...")
     try:
-        with open(filename, 'r') as f:
-            settings = yaml.safe_load(f)
+        settings = read_settings_cached(filename)
         if not settings:
             logger.warning(f"Settings file '{filename}' is empty.")
             return None
@@ -463,23 +463,32 @@ def load_settings(filename):
         return None
 
 # --- Authentication ---
-def authenticate_google_sheets():
-    """Authenticates using Streamlit secrets or local service account file."""
+def load_credentials():
+    """Loads service account credentials from Streamlit secrets or the local key file."""
     creds = None
-    # Check if running in Streamlit Cloud (or secrets are configured)
+    # Streamlit is imported here rather than at module level: the scripts only need it
+    # to read secrets, and this lets them run from a plain Python environment too
     try:
-        if 'GOOGLE_CREDENTIALS' in st.secrets:
-            logger.info("Loading credentials from Streamlit secrets...")
-            creds_info = st.secrets["GOOGLE_CREDENTIALS"].to_dict()
-            logger.debug(f"Streamlit secrets credentials keys: {list(creds_info.keys())}")
-            creds = service_account.Credentials.from_service_account_info(
-                creds_info, scopes=SCOPES)
-            logger.info("Credentials loaded successfully from secrets.")
-    except (KeyError, FileNotFoundError, st.errors.StreamlitAPIException) as e:
-        logger.info(f"Streamlit secrets not found or inaccessible: {e}. Falling back to local service account file...")
-    except Exception as e:
-        logger.error(f"Error parsing Streamlit secrets credentials: {e}")
-        return None
+        import streamlit as st
+    except ImportError:
+        st = None
+        logger.info("Streamlit is not installed. Falling back to local service account file...")
+
+    if st is not None:
+        # Check if running in Streamlit Cloud (or secrets are configured)
+        try:
+            if 'GOOGLE_CREDENTIALS' in st.secrets:
+                logger.info("Loading credentials from Streamlit secrets...")
+                creds_info = st.secrets["GOOGLE_CREDENTIALS"].to_dict()
+                logger.debug(f"Streamlit secrets credentials keys: {list(creds_info.keys())}")
+                creds = service_account.Credentials.from_service_account_info(
+                    creds_info, scopes=SCOPES)
+                logger.info("Credentials loaded successfully from secrets.")
+        except (KeyError, FileNotFoundError, st.errors.StreamlitAPIException) as e:
+            logger.info(f"Streamlit secrets not found or inaccessible: {e}. Falling back to local service account file...")
+        except Exception as e:
+            logger.error(f"Error parsing Streamlit secrets credentials: {e}")
+            return None
 
     # Fallback to local service account file if secrets are unavailable
     if creds is None:
@@ -495,13 +504,20 @@ def authenticate_google_sheets():
             logger.error(f"Error loading service account credentials from file: {e}")
             return None
 
+    return creds
+
+def authenticate_google_sheets():
+    """Authenticates using Streamlit secrets or local service account file."""
+    creds = load_credentials()
     if creds is None:
         logger.error("No valid credentials loaded. Authentication failed.")
         return None
 
     logger.info("Building Google Sheets API service...")
     try:
-        service = build('sheets', 'v4', credentials=creds)
+        # static_discovery=True uses the discovery document bundled with google-api-python-client
+        # instead of fetching it over the network; cache_discovery=False skips the file cache probe/write
+        service = build('sheets', 'v4', credentials=creds, static_discovery=True, cache_discovery=False)
         return service
     except RefreshError as e:
         logger.error(f"Authentication failed due to invalid credentials: {e}")
@@ -544,22 +560,19 @@ def read_orders_sheet(service, spreadsheet_id):
             logger.error(f"Data start row index ({ORDERS_DATA_START_ROW_INDEX}) is out of bounds (total rows: {len(values)}).")
             return None
 
-        # Pad data rows to match header length
+        # Pad data rows to match header length, writing each one straight into a single '' filled object array
         data_rows_raw = values[ORDERS_DATA_START_ROW_INDEX:]
-        padded_data_rows = []
+        data = np.full((len(data_rows_raw), header_length), '', dtype=object)
         for i, row in enumerate(data_rows_raw):
-            processed_row = [str(cell).strip() if cell is not None else '' for cell in row]
-            if len(processed_row) < header_length:
-                processed_row.extend([''] * (header_length - len(processed_row)))
-            elif len(processed_row) > header_length:
-                logger.warning(f"Orders Row {ORDERS_DATA_START_ROW_INDEX + i + 1} has more columns ({len(processed_row)}) than header ({header_length}). Truncating.")
-                processed_row = processed_row[:header_length]
-            padded_data_rows.append(processed_row)
+            if len(row) > header_length:
+                logger.warning(f"Orders Row {ORDERS_DATA_START_ROW_INDEX + i + 1} has more columns ({len(row)}) than header ({header_length}). Truncating.")
+                row = row[:header_length]
+            data[i, :len(row)] = [str(cell).strip() if cell is not None else '' for cell in row]
 
-        logger.info(f"Processed {len(padded_data_rows)} Orders data rows.")
+        logger.info(f"Processed {len(data)} Orders data rows.")
 
         # Create DataFrame
-        df = pd.DataFrame(padded_data_rows, columns=header)
+        df = pd.DataFrame(data, columns=header, copy=False)
         df['_original_row_index'] = range(ORDERS_DATA_START_ROW_INDEX + 1, ORDERS_DATA_START_ROW_INDEX + 1 + len(df))
 
         # Ensure required columns exist
@@ -623,36 +636,37 @@ def prepare_status_updates(orders_df, csv_df):
     order_status_col = COL_NAMES_ORDERS['order_status']
     name_col = COL_NAMES_ORDERS['name']
 
+    # Build the Order Name -> CSV status lookup once (first occurrence wins, assuming Order Name is unique)
+    first_csv_rows = csv_df.drop_duplicates(subset='Order Name', keep='first')
+    csv_status_by_name = dict(zip(first_csv_rows['Order Name'], first_csv_rows['Order Status']))
+
     # Iterate through filtered Orders rows
-    for idx, orders_row in orders_df.iterrows():
-        order_name = orders_row[name_col]  # e.g., #1448
+    for order_name, current_status, original_row_index in zip(
+            orders_df[name_col], orders_df[order_status_col], orders_df['_original_row_index']):
+        # order_name e.g., #1448
         if not order_name:
-            logger.debug(f"Skipping Orders row {orders_row['_original_row_index']}: Empty Name.")
+            logger.debug(f"Skipping Orders row {original_row_index}: Empty Name.")
             continue
 
-        # Find matching CSV row
-        matching_csv_rows = csv_df[csv_df['Order Name'] == order_name]
-        if matching_csv_rows.empty:
-            logger.debug(f"No CSV match found for Order Name '{order_name}' (Orders row {orders_row['_original_row_index']}).")
+        # Find matching CSV status
+        csv_status = csv_status_by_name.get(order_name)
+        if csv_status is None:
+            logger.debug(f"No CSV match found for Order Name '{order_name}' (Orders row {original_row_index}).")
             continue
 
-        # Use the first matching row (assuming Order Name is unique)
-        csv_row = matching_csv_rows.iloc[0]
-        csv_status = csv_row['Order Status']
         mapped_status = STATUS_MAPPING.get(csv_status)
 
         if not mapped_status:
-            logger.debug(f"Order Name '{order_name}' (Orders row {orders_row['_original_row_index']}): CSV status '{csv_status}' not in mapping. Skipping.")
+            logger.debug(f"Order Name '{order_name}' (Orders row {original_row_index}): CSV status '{csv_status}' not in mapping. Skipping.")
             continue
 
         # Check if update is needed
-        current_status = orders_row[order_status_col]
         if current_status == mapped_status:
-            logger.debug(f"Order Name '{order_name}' (Orders row {orders_row['_original_row_index']}): Order Status already '{mapped_status}'. No update needed.")
+            logger.debug(f"Order Name '{order_name}' (Orders row {original_row_index}): Order Status already '{mapped_status}'. No update needed.")
             continue
 
         # Prepare update
-        original_row = int(orders_row['_original_row_index'])  # 1-based
+        original_row = int(original_row_index)  # 1-based
         updates.append({
             'order_name': order_name,
             'row_index': original_row,
@@ -673,23 +687,13 @@ def execute_batch_update(service, updates, orders_df, spreadsheet_id):
     logger.info(f"Preparing batch update for {len(updates)} rows in Orders sheet...")
     sheet = service.spreadsheets()
 
-    # Find the Order Status column index
+    # Find the Order Status column index from the header already read with the Orders sheet
+    # (DataFrame columns follow the sheet header order, so no extra API round-trip is needed)
+    order_status_col = COL_NAMES_ORDERS['order_status']
     try:
-        header_range = f'{ORDERS_SHEET_NAME}!A{ORDERS_HEADER_ROW_INDEX + 1}:AZ{ORDERS_HEADER_ROW_INDEX + 1}'
-        result = sheet.values().get(spreadsheetId=spreadsheet_id, range=header_range).execute()
-        header = result.get('values', [[]])[0]
-        header = [str(h).strip() if h is not None else '' for h in header]
-        order_status_col = COL_NAMES_ORDERS['order_status']
-        try:
-            status_col_index = header.index(order_status_col)
-        except ValueError:
-            logger.error(f"Column '{order_status_col}' not found in Orders sheet header.")
-            return
-    except HttpError as e:
-        logger.error(f"Google Sheets API Error while reading header: {e}")
-        return
-    except Exception as e:
-        logger.exception("Unexpected error while reading header:")
+        status_col_index = list(orders_df.columns).index(order_status_col)
+    except ValueError:
+        logger.error(f"Column '{order_status_col}' not found in Orders sheet header.")
         return
 
     # Prepare batch update data
@@ -1,15 +1,25 @@
 # pages/1_⚙️_Settings.py
 import streamlit as st
 import yaml
+from settings_io import YamlLoader, clear_settings_cache
 from pathlib import Path
-import os
 import copy # Needed for deep copying settings
 
 # --- Configuration ---
 PROJECT_ROOT = Path(__file__).parent.parent.resolve() # Go up one level from pages
 SETTINGS_FILE = PROJECT_ROOT / "settings.yaml"
 
+# --- Page Configuration ---
+# Must be the first Streamlit call on the page, before session-state init can emit messages
+st.set_page_config(page_title="Settings", page_icon="⚙️")
+
 # --- Helper Functions ---
+@st.cache_data(show_spinner=False)
+def read_settings_file(mtime_ns):
+    """Parses the YAML file. Cached per modification time, so edits on disk are picked up."""
+    with open(SETTINGS_FILE, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
 def load_settings():
     """Loads settings from the YAML file."""
     if not SETTINGS_FILE.is_file():
@@ -18,9 +28,8 @@ def load_settings():
         # Returning None seems safer to force user awareness.
         return None
     try:
-        with open(SETTINGS_FILE, 'r') as f:
-            # Use deepcopy to avoid modifying the original loaded dict accidentally
-            return yaml.safe_load(f)
+        # cache_data hands back a fresh copy on every hit, so callers may modify the result
+        return read_settings_file(SETTINGS_FILE.stat().st_mtime_ns)
     except Exception as e:
         st.error(f"Error loading settings: {e}")
         return None
@@ -39,6 +48,8 @@ def save_settings(data):
 
         with open(SETTINGS_FILE, 'w') as f:
             yaml.dump(data, f, sort_keys=False, default_flow_style=False)
+        read_settings_file.clear() # mtime can stay the same on filesystems with coarse timestamps
+        clear_settings_cache(SETTINGS_FILE) # The scripts' parsed-settings sidecar
         st.success("Settings saved successfully!")
         return True
     except Exception as e:
@@ -133,7 +144,6 @@ def save_all_settings():
 
 
 # --- Page Content ---
-st.set_page_config(page_title="Settings", page_icon="⚙️")
 st.title("⚙️ Configure Settings")
 st.markdown("Modify application settings and stakeholder details below.")
 
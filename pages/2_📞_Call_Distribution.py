@@ -5,13 +5,16 @@ import time
 import sys
 from pathlib import Path
 import os
-import select # Needed for non-blocking read (optional but better)
 
 # --- Configuration ---
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 SCRIPT_PATH = PROJECT_ROOT / "distributionV2.py"
 PYTHON_EXECUTABLE = sys.executable # Use the same python that runs streamlit
 
+# --- Page Configuration ---
+# Must be the first Streamlit call on the page
+st.set_page_config(page_title="Call Distribution", page_icon="📞")
+
 # --- Initialize Session State ---
 if 'dist_process' not in st.session_state:
     st.session_state.dist_process = None
@@ -81,7 +84,6 @@ def stop_script():
 
 # --- Page Content ---
 # Note: layout="wide" is set in dashboard.py and applies here
-st.set_page_config(page_title="Call Distribution", page_icon="📞")
 st.title("📞 Run Call Distribution")
 st.markdown(f"Execute the `{SCRIPT_PATH.name}` script to distribute calls/leads.")
 
@@ -117,10 +119,9 @@ if st.session_state.get('dist_running') and st.session_state.get('dist_process')
     new_output = ""
     try:
         # Non-blocking read (optional, but better for responsiveness)
-        # This requires the 'select' module
-        # Set the stdout stream to non-blocking
+        # Set the stdout stream to non-blocking via fcntl
         # Note: Non-blocking I/O might behave differently on Windows
-        if os.name != 'nt': # select works best on Unix-like systems
+        if os.name != 'nt': # fcntl is only available on Unix-like systems
             import fcntl
             flags = fcntl.fcntl(proc.stdout, fcntl.F_GETFL)
             fcntl.fcntl(proc.stdout, fcntl.F_SETFL, flags | os.O_NONBLOCK)
@@ -4,9 +4,9 @@ import subprocess
 import time
 import sys
 import yaml
+from settings_io import YamlLoader, clear_settings_cache
 from pathlib import Path
 import os
-import select # For non-blocking reads later
 
 # --- Configuration ---
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
@@ -14,16 +14,26 @@ SETTINGS_FILE = PROJECT_ROOT / "settings.yaml"
 SCRIPT_PATH = PROJECT_ROOT / "order_status_update.py"
 PYTHON_EXECUTABLE = sys.executable # Use the same python that runs streamlit
 
+# --- Page Configuration ---
+# Must be the first Streamlit call on the page
+st.set_page_config(page_title="Order Status Update", page_icon="📊")
+
 # --- Helper Functions ---  <<<< MOVED UP
 # (Consider moving load/save to a utils.py file)
+@st.cache_data(show_spinner=False)
+def read_settings_file(mtime_ns):
+    """Parses the YAML file. Cached per modification time, so edits on disk are picked up."""
+    with open(SETTINGS_FILE, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
 def load_settings():
     """Loads settings, returns None on failure."""
     if not SETTINGS_FILE.is_file():
         # Don't show error here, let calling function decide
         return None
     try:
-        with open(SETTINGS_FILE, 'r') as f:
-            return yaml.safe_load(f)
+        # cache_data hands back a fresh copy on every hit, so callers may modify the result
+        return read_settings_file(SETTINGS_FILE.stat().st_mtime_ns)
     except Exception as e:
         # Use st.warning for non-critical load errors during init maybe?
         # Or just let it return None silently during init.
@@ -36,6 +46,8 @@ def save_settings(data):
     try:
         with open(SETTINGS_FILE, 'w') as f:
             yaml.dump(data, f, sort_keys=False, default_flow_style=False)
+        read_settings_file.clear() # mtime can stay the same on filesystems with coarse timestamps
+        clear_settings_cache(SETTINGS_FILE) # The scripts' parsed-settings sidecar
         return True
     except Exception as e:
         st.error(f"Error saving settings: {e}")
@@ -139,7 +151,6 @@ if 'current_master_csv_display' not in st.session_state:
 
 
 # --- Page Content ---
-st.set_page_config(page_title="Order Status Update", page_icon="📊")
 st.title("📊 Run Order Status Update")
 st.markdown(f"Upload a new Master Report CSV and run the `{SCRIPT_PATH.name}` script.")
 st.divider()
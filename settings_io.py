@@ -0,0 +1,66 @@
+# settings_io.py
+# Shared settings.yaml parsing for the scripts and the Streamlit pages
+import os
+import json
+import hashlib
+import logging
+import yaml
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml-backed C parser
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+SETTINGS_CACHE_SUFFIX = '.cache.json'  # Parsed settings are cached next to the YAML file
+
+logger = logging.getLogger(__name__)
+
+def clear_settings_cache(filename):
+    """Deletes the JSON sidecar cache of the YAML file, if there is one."""
+    try:
+        os.remove(f"{filename}{SETTINGS_CACHE_SUFFIX}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove settings cache for '{filename}': {e}")
+
+def read_settings_cached(filename):
+    """Parses the YAML file, reusing the JSON sidecar cache while the YAML file's contents are unchanged."""
+    cache_path = f"{filename}{SETTINGS_CACHE_SUFFIX}"
+    # Keyed on a hash of the file's bytes rather than its mtime: a save within the filesystem's
+    # timestamp resolution keeps the same mtime. Reading the bytes is cheap next to parsing them
+    with open(filename, 'rb') as f:
+        source_bytes = f.read()
+    source_digest = hashlib.sha256(source_bytes).hexdigest()
+
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('source_digest') == source_digest:
+            logger.debug(f"Using cached settings from '{cache_path}'.")
+            return cached['settings']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass # Missing, stale or unreadable cache; fall back to parsing the YAML
+
+    settings = yaml.load(source_bytes, Loader=YamlLoader)
+
+    # Only settings that come back from JSON exactly as parsed are cached. Non-string keys, dates
+    # and the like would otherwise change type on the next (cached) load
+    try:
+        cache_text = json.dumps({'source_digest': source_digest, 'settings': settings})
+    except (TypeError, ValueError):
+        cache_text = None
+    if cache_text is None or json.loads(cache_text)['settings'] != settings:
+        logger.debug(f"Settings in '{filename}' don't round-trip through JSON. Not caching them.")
+        return settings
+
+    # Write to a temp file and rename so a concurrent run never reads a half-written cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(cache_text)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write settings cache '{cache_path}': {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return settings